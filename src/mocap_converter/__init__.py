@@ -1,12 +1,44 @@
-from . import adapter
-from .adjust_kinematic_tree import adjust_kinematic_tree
-from .io.bvh.loader import load_bvh
-from .io.bvh.saver import save_bvh
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .kinematic_tree import KinematicTree
 from .motion_data import MotionData
 from .node import Node
-from .pos2rot import get_rotations_from_positions
-from .rot2pos import get_positions_from_rotations
+
+if TYPE_CHECKING:
+    from . import adapter
+    from .adjust_kinematic_tree import adjust_kinematic_tree
+    from .io.bvh.loader import load_bvh
+    from .io.bvh.saver import save_bvh
+    from .pos2rot import get_rotations_from_positions
+    from .rot2pos import get_position_array_from_rotations, get_positions_from_rotations
+
+# Submodules that pull in scipy are imported on first attribute access (PEP 562),
+# so importing the package for Node, KinematicTree or MotionData stays cheap
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "adapter": (".adapter", None),
+    "adjust_kinematic_tree": (".adjust_kinematic_tree", "adjust_kinematic_tree"),
+    "load_bvh": (".io.bvh.loader", "load_bvh"),
+    "save_bvh": (".io.bvh.saver", "save_bvh"),
+    "get_rotations_from_positions": (".pos2rot", "get_rotations_from_positions"),
+    "get_positions_from_rotations": (".rot2pos", "get_positions_from_rotations"),
+    "get_position_array_from_rotations": (".rot2pos", "get_position_array_from_rotations"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "adapter",
@@ -18,4 +50,5 @@ __all__ = [
     "Node",
     "get_rotations_from_positions",
     "get_positions_from_rotations",
+    "get_position_array_from_rotations",
 ]
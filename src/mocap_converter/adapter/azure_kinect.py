@@ -46,26 +46,23 @@ def get_positions_from_json(json_data: dict[str, Any]) -> dict[str, NDArray[np.f
     assert "frames" in json_data
     frames: list[dict[str, Any]] = json_data["frames"]
 
-    positions: list[NDArray[np.float64]] = []
-    end_frame = None
-    for frame in frames:
-        if frame["num_bodies"] == 0:
-            if len(positions) > 0:
-                positions.append(positions[-1])
-            continue
+    # Frames before the first and after the last tracked body are dropped
+    tracked = [i for i, frame in enumerate(frames) if frame["num_bodies"] > 0]
+    first_frame, last_frame = tracked[0], tracked[-1]
+    joint_count = len(frames[first_frame]["bodies"][0]["joint_positions"])
 
-        if frame["num_bodies"] > 1 and len(positions) > 0:
-            prepositions = np.array(positions[-1])
-            distances = [np.linalg.norm(prepositions - np.array(body["joint_positions"])) for body in frame["bodies"]]
-            idx = np.argmin(distances)
-            positions.append(frame["bodies"][idx]["joint_positions"])
+    positions_np = np.empty((last_frame - first_frame + 1, joint_count, 3), dtype=np.float64)
+    for i, frame in enumerate(frames[first_frame : last_frame + 1]):
+        if frame["num_bodies"] == 0:  # Hold the previous pose
+            positions_np[i] = positions_np[i - 1]
+        elif frame["num_bodies"] > 1 and i > 0:  # Follow the body closest to the previous pose
+            candidates = np.array([body["joint_positions"] for body in frame["bodies"]], dtype=np.float64)
+            distances = np.linalg.norm(candidates - positions_np[i - 1], axis=(1, 2))
+            positions_np[i] = candidates[np.argmin(distances)]
         else:
-            positions.append(frame["bodies"][0]["joint_positions"])
-        end_frame = len(positions)
+            positions_np[i] = frame["bodies"][0]["joint_positions"]
 
-    if end_frame is not None:
-        positions = positions[:end_frame]
-    positions_np = np.array(positions) / 10  # mm -> cm
+    positions_np /= 10  # mm -> cm
     positions_np[:, :, 1] *= -1  # flip y axis
     positions_np[:, :, 2] *= -1  # flip z axis
     positions_np -= positions_np[0:1, 0:1]  # Move root joint of first frame to origin
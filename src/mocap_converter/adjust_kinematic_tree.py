@@ -8,22 +8,25 @@ from mocap_converter.node import Node
 def adjust_kinematic_tree(
     tree: KinematicTree, positions: dict[str, NDArray[np.float64]], frame: int = 0
 ) -> KinematicTree:
-    new_nodes: list[Node] = []
-    for node in tree.nodes.values():
-        position = positions[node.name]
-        parent = tree.get_parent(node.name)
-        if parent is None:
-            new_nodes.append(node.copy_with(offset=position[frame]))
-            continue
-        else:
-            parent_position = positions[parent.name]
-            offsets = position - parent_position
-            offset_norms: NDArray[np.float64] = np.linalg.norm(offsets, axis=1)
-            mean_norm = float(np.mean(offset_norms))
+    nodes = list(tree.nodes.values())
+    index = {node.name: i for i, node in enumerate(nodes)}
+    # Roots point at themselves, so their offset rows come out as zeros and are replaced below
+    parent_indices = [index[node.parent_name] if node.parent_name is not None else i for i, node in enumerate(nodes)]
 
-            offset = offsets[frame]
-            offset_norm = offset_norms[frame]
-            normalized_offset = offset / offset_norm if offset_norm > 0.0 else offset
-            new_nodes.append(node.copy_with(offset=normalized_offset * mean_norm))
+    # All nodes at once: (n_nodes, n_frames, 3) positions and offsets, (n_nodes, n_frames) lengths
+    all_positions = np.stack([positions[node.name] for node in nodes])
+    offsets = all_positions - all_positions[parent_indices]
+    offset_norms: NDArray[np.float64] = np.linalg.norm(offsets, axis=2)
+    mean_norms = np.mean(offset_norms, axis=1)
 
-    return KinematicTree.from_nodes(new_nodes)
+    offset = offsets[:, frame]
+    offset_norm = offset_norms[:, frame, np.newaxis]
+    # Zero-length offsets stay zero; dividing them by 1 keeps the division warning-free
+    normalized_offsets = offset / np.where(offset_norm > 0.0, offset_norm, 1.0) * mean_norms[:, np.newaxis]
+
+    new_nodes: list[Node] = [
+        node.copy_with(offset=all_positions[i, frame] if node.is_root else normalized_offsets[i])
+        for i, node in enumerate(nodes)
+    ]
+    # Only offsets changed; names and parent links are those of the already validated tree
+    return KinematicTree.from_nodes(new_nodes, validate=False)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cache, cached_property
 
 from mocap_converter.io.bvh.types import (
     CHANNEL_TYPES,
@@ -19,20 +20,15 @@ class BVHChannelLayout:
 
     @classmethod
     def from_bvh_channels(cls, channels: tuple[CHANNEL_TYPES, ...]) -> "BVHChannelLayout":
-        position_channels = filter_position_channels(channels)
-        rotation_channels = filter_rotation_channels(channels)
-        return cls(position_channels, rotation_channels)
+        return cls(*_split_channels(channels))
 
     @classmethod
     def from_rotation_order(cls, rotation_order: ROTATION_ORDER, has_position_channels: bool) -> "BVHChannelLayout":
-        position_channels: tuple[POSITION_CHANNELS, ...] = (
-            ("Xposition", "Yposition", "Zposition") if has_position_channels else ()
-        )
-        rotation_channels = rotation_channels_from_order(rotation_order)
-        return cls(position_channels, rotation_channels)
+        return cls(*_channels_for_order(rotation_order, has_position_channels))
 
-    @property
+    @cached_property
     def channels(self) -> tuple[CHANNEL_TYPES, ...]:
+        # Concatenated once per layout; channel_count and the loader/saver read it repeatedly
         return self.position_channels + self.rotation_channels
 
     @property
@@ -47,6 +43,25 @@ class BVHChannelLayout:
     def has_rotation_channels(self) -> bool:
         return bool(self.rotation_channels)
 
-    @property
+    @cached_property
     def rotation_order(self) -> ROTATION_ORDER:
+        # Static per layout; resolved on first access instead of on every call
         return rotation_order_from_channels(self.rotation_channels)
+
+
+# Joints repeat a handful of channel layouts, so the channel tuples are derived once per distinct input
+@cache
+def _split_channels(
+    channels: tuple[CHANNEL_TYPES, ...],
+) -> tuple[tuple[POSITION_CHANNELS, ...], tuple[ROTATION_CHANNELS, ...]]:
+    return filter_position_channels(channels), filter_rotation_channels(channels)
+
+
+@cache
+def _channels_for_order(
+    rotation_order: ROTATION_ORDER, has_position_channels: bool
+) -> tuple[tuple[POSITION_CHANNELS, ...], tuple[ROTATION_CHANNELS, ...]]:
+    position_channels: tuple[POSITION_CHANNELS, ...] = (
+        ("Xposition", "Yposition", "Zposition") if has_position_channels else ()
+    )
+    return position_channels, rotation_channels_from_order(rotation_order)
@@ -1,29 +1,40 @@
+import array
+import functools
+import mmap
+import os
+import sys
+import warnings
 from dataclasses import dataclass
-from pathlib import Path
 from types import MappingProxyType
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.transform import Rotation as R
 
 from mocap_converter.io.bvh.channel_layout import BVHChannelLayout
-from mocap_converter.io.bvh.types import CHANNEL_TYPES, validate_channel
+from mocap_converter.io.bvh.types import CHANNEL_CODES, CHANNEL_TYPES, validate_channel
 from mocap_converter.kinematic_tree import KinematicTree
 from mocap_converter.motion_data import MotionData
 from mocap_converter.node import Node
+from mocap_converter.quaternion import from_euler
+
+
+_MOTION_HEADER_LINE_COUNT = 3  # "MOTION", "Frames: N", "Frame Time: T"
 
 
 # === Immutable Data Structures ===
 @dataclass(frozen=True)
 class BVHSections:
-    hierarchy_lines: tuple[str, ...]
-    motion_lines: tuple[str, ...]
+    hierarchy_lines: tuple[tuple[str, ...], ...]  # Tokens of each hierarchy line; index + 1 is the line number
+    motion_lines: tuple[str, ...]  # Motion header lines only
+    frame_data: bytes  # Raw whitespace-separated frame values following the header
 
 
 @dataclass(frozen=True)
 class ParsedHierarchy:
     kinematic_tree: KinematicTree
     node_channels: MappingProxyType[str, BVHChannelLayout]
+    # Same layouts in channel order as a flat tuple, for iteration without mapping-proxy dispatch
+    node_channels_ordered: tuple[tuple[str, BVHChannelLayout], ...]
 
 
 @dataclass(frozen=True)
@@ -31,7 +42,18 @@ class ParsedMotion:
     hierarchy: ParsedHierarchy
     frame_count: int
     frame_time: float
-    frames: tuple[tuple[float, ...], ...]
+    frames: NDArray[np.float64]  # (frame_count, channel_count)
+
+
+@dataclass(frozen=True)
+class _NodeColumns:
+    """Column indices of one node's channels in the (frames, channels) matrix"""
+
+    name: str
+    pos_axes: tuple[int, ...]  # X/Y/Z axis index for each position column
+    pos_cols: tuple[int, ...]
+    rot_cols: tuple[int, ...]
+    rot_order: str  # Rotation axes in channel order, e.g. "ZXY"
 
 
 class ParseError(Exception):
@@ -41,65 +63,87 @@ class ParseError(Exception):
 # === Core Parsing Functions ===
 
 
-def split_into_sections(content: str) -> BVHSections:
-    """Split BVH content into hierarchy and motion sections"""
-    lines = [line.strip() for line in content.splitlines() if line.strip()]
-
-    motion_index = None
-    for i, line in enumerate(lines):
-        if line == "MOTION":
-            motion_index = i
-            break
+def split_into_sections(content: str | bytes | mmap.mmap) -> BVHSections:
+    """Split BVH content into hierarchy line tokens, motion header lines and raw frame data"""
+    buffer = content.encode() if isinstance(content, str) else content
 
-    if motion_index is None:
+    motion_start = _find_motion_line(buffer)
+    if motion_start == -1:
         raise ParseError("MOTION section not found in BVH file")
 
-    hierarchy_lines = tuple(lines[:motion_index])
-    motion_lines = tuple(lines[motion_index:])
+    # Only the small hierarchy prefix is decoded; lines are kept so errors can name them
+    hierarchy = buffer[:motion_start].decode()
+    hierarchy_lines = tuple(tuple(line.split()) for line in hierarchy.splitlines())
 
-    return BVHSections(hierarchy_lines, motion_lines)
+    # Read the motion header line by line, leaving the (large) frame data as undecoded bytes
+    motion_lines: list[str] = []
+    pos = motion_start
+    while len(motion_lines) < _MOTION_HEADER_LINE_COUNT and pos < len(buffer):
+        end = _find_line_end(buffer, pos)
+        line = buffer[pos:end].strip()
+        if line:
+            motion_lines.append(line.decode())
+        pos = end + 1
+
+    return BVHSections(hierarchy_lines, tuple(motion_lines), buffer[pos:])
 
 
 def parse_hierarchy_section(sections: BVHSections) -> ParsedHierarchy:
-    """Parse the hierarchy section to extract nodes and channels"""
-    nodes: list[Node] = []
+    """Parse the hierarchy lines to extract nodes and channels"""
+    # Collect plain names/parents/offsets and materialize each immutable Node once at the end
+    node_parents: list[tuple[str, str | None]] = []
+    offset_owners: list[str] = []
+    offset_line_numbers: list[int] = []
+    offset_tokens: list[str] = []
     node_channels: dict[str, BVHChannelLayout] = {}
     node_stack: list[str] = []
     current_node_name: str | None = None
 
-    for line_num, line in enumerate(sections.hierarchy_lines):
-        tokens = line.split()
+    for line_number, tokens in enumerate(sections.hierarchy_lines, start=1):
         if not tokens:
             continue
+        keyword = tokens[0]
 
-        if tokens[0] in ("ROOT", "JOINT", "End"):
-            node = _parse_node_line(current_node_name, tokens)
-            nodes.append(node)
-            node_stack.append(node.name)
-            current_node_name = node.name
+        if keyword in ("ROOT", "JOINT", "End"):
+            node_name, parent_name = _parse_node_line(current_node_name, tokens, line_number)
+            node_parents.append((node_name, parent_name))
+            node_stack.append(node_name)
+            current_node_name = node_name
 
-        elif tokens[0] == "OFFSET":
+        elif keyword == "OFFSET":
             if current_node_name is None:
-                raise ParseError("OFFSET specified before node definition", line_num)
+                raise ParseError(f"OFFSET specified before node definition at line {line_number}")
 
-            offset = _parse_offset_line(tokens[1:])
-            # Update the node with offset
-            nodes[-1] = nodes[-1].copy_with(offset=offset)
+            offset_values = tokens[1:]
+            if len(offset_values) != 3:
+                raise ParseError(f"Invalid OFFSET values at line {line_number}: {' '.join(offset_values)}")
+            offset_owners.append(current_node_name)
+            offset_line_numbers.append(line_number)
+            offset_tokens.extend(offset_values)
 
-        elif tokens[0] == "}":
+        elif keyword == "}":
             if not node_stack:
-                raise ParseError("'}' found without corresponding node", line_num)
+                raise ParseError(f"'}}' found without corresponding node at line {line_number}")
             node_stack.pop()
             current_node_name = node_stack[-1] if node_stack else None
 
-        elif tokens[0] == "CHANNELS":
+        elif keyword == "CHANNELS":
             if current_node_name is None:
-                raise ParseError("CHANNELS specified before node definition", line_num)
+                raise ParseError(f"CHANNELS specified before node definition at line {line_number}")
 
-            channel_layout = _parse_channels_line(tokens)
+            channel_layout = _parse_channels_line(tokens, line_number)
             node_channels[current_node_name] = channel_layout
 
-    return ParsedHierarchy(KinematicTree.from_nodes(nodes), MappingProxyType(node_channels))
+    offsets = _parse_offsets(offset_owners, offset_line_numbers, offset_tokens)
+    nodes = [
+        Node(name=name, parent_name=parent_name, offset=offsets[name])
+        if name in offsets
+        else Node(name=name, parent_name=parent_name)
+        for name, parent_name in node_parents
+    ]
+    return ParsedHierarchy(
+        KinematicTree.from_nodes(nodes), MappingProxyType(node_channels), tuple(node_channels.items())
+    )
 
 
 def parse_motion_data(hierarchy: ParsedHierarchy, sections: BVHSections) -> ParsedMotion:
@@ -128,105 +172,245 @@ def parse_motion_data(hierarchy: ParsedHierarchy, sections: BVHSections) -> Pars
     except ValueError:
         raise ParseError(f"Invalid frame time: {time_line[2]}")
 
-    # Parse frame data
-    frame_data_lines = motion_lines[2:]
-    frames: list[tuple[float, ...]] = []
-
-    expected_channels = sum(ch.channel_count for ch in hierarchy.node_channels.values())
+    # Parse frame data in a single C-level pass instead of per-line float conversion
+    expected_channels = sum(ch.channel_count for _, ch in hierarchy.node_channels_ordered)
 
-    for frame_line in frame_data_lines:
-        if not frame_line.strip():
-            continue
+    values = _parse_floats(sections.frame_data)
+    if (
+        values is not None
+        and values.size == frame_count * expected_channels
+        and _has_uniform_rows(sections.frame_data, frame_count, expected_channels)
+    ):
+        frames = values.reshape(frame_count, expected_channels)
+    else:
+        # Slow path: accepts tokens only Python's float() understands, or pinpoints the offending frame
+        frames = _parse_frame_lines(sections.frame_data, frame_count, expected_channels)
 
-        try:
-            values = tuple(map(float, frame_line.split()))
-            if len(values) != expected_channels:
-                raise ParseError(f"Expected {expected_channels} values, got {len(values)}")
-            frames.append(values)
-        except ValueError as e:
-            raise ParseError(f"Invalid frame data: {str(e)}")
+    # ParsedMotion is frozen; keep its frame matrix immutable too
+    frames.setflags(write=False)
 
-    if len(frames) != frame_count:
-        raise ParseError(f"Frame count mismatch: expected {frame_count}, got {len(frames)}")
-
-    return ParsedMotion(hierarchy, frame_count, frame_time, tuple(frames))
+    return ParsedMotion(hierarchy, frame_count, frame_time, frames)
 
 
 def build_motion_data_efficiently(parsed: ParsedMotion) -> MotionData:
-    """Build MotionData with O(N) efficiency using pre-allocated arrays"""
-
-    # Pre-allocate arrays based on frame count
+    """Build MotionData with one vectorized column gather per node instead of a per-frame loop"""
     position_arrays: dict[str, NDArray[np.float64]] = {}
     rotation_arrays: dict[str, NDArray[np.float64]] = {}
+    source_euler: dict[str, tuple[str, NDArray[np.float64]]] = {}
 
-    for node_name, channel_layout in parsed.hierarchy.node_channels.items():
-        if channel_layout.has_position_channels:
-            position_arrays[node_name] = np.empty((parsed.frame_count, 3), dtype=np.float64)
-        if channel_layout.has_rotation_channels:
-            rotation_arrays[node_name] = np.empty((parsed.frame_count, 4), dtype=np.float64)
+    plan = _plan_node_columns(parsed.hierarchy.node_channels_ordered)
 
-    # Populate arrays directly (O(N) instead of O(N²))
-    for frame_idx, frame_data in enumerate(parsed.frames):
-        offset = 0
-        for node_name, channel_layout in parsed.hierarchy.node_channels.items():
-            values = frame_data[offset : offset + channel_layout.channel_count]
-            position, rotation = _parse_channel_values(channel_layout.channels, values)
+    position_plan = [columns for columns in plan if columns.pos_cols]
+    rotation_plan = [columns for columns in plan if columns.rot_cols]
 
-            if channel_layout.has_position_channels:
-                position_arrays[node_name][frame_idx] = position
-            if channel_layout.has_rotation_channels:
-                rotation_arrays[node_name][frame_idx] = rotation.as_quat()
+    # One frame-major block per kind, so a pass over all joints at a frame touches contiguous memory;
+    # MotionData receives zero-copy per-joint views
+    all_positions = np.zeros((parsed.frame_count, len(position_plan), 3), dtype=np.float64)
+    all_rotations = np.empty((parsed.frame_count, len(rotation_plan), 4), dtype=np.float64)
 
-            offset += channel_layout.channel_count
+    for j, columns in enumerate(position_plan):
+        positions = all_positions[:, j]
+        positions[:, columns.pos_axes] = parsed.frames[:, columns.pos_cols]
+        position_arrays[columns.name] = positions
 
-    return MotionData(parsed.hierarchy.kinematic_tree, position_arrays, rotation_arrays, parsed.frame_time)
+    for j, columns in enumerate(rotation_plan):
+        # One closed-form batched conversion per node over all frames
+        euler_angles = parsed.frames[:, columns.rot_cols]
+        rotations = from_euler(columns.rot_order, euler_angles, degrees=True, out=all_rotations[:, j])
+        rotation_arrays[columns.name] = rotations
+        # The gathered columns are already a copy; keep them so an unedited save can reuse them
+        source_euler[columns.name] = (columns.rot_order, euler_angles)
+
+    return MotionData(
+        parsed.hierarchy.kinematic_tree,
+        position_arrays,
+        rotation_arrays,
+        parsed.frame_time,
+        source_euler=source_euler,
+    )
 
 
 # === Helper Functions ===
 
 
-def _parse_node_line(current_node_name: str | None, tokens: list[str]) -> Node:
-    """Parse a node declaration line"""
+def _plan_node_columns(node_channels: tuple[tuple[str, BVHChannelLayout], ...]) -> tuple[_NodeColumns, ...]:
+    """Resolve every node's channel columns in one linear scan over the hierarchy"""
+    plan: list[_NodeColumns] = []
+    offset = 0
+    for node_name, channel_layout in node_channels:
+        pos_axes, pos_cols, rot_cols, rot_order = _resolve_layout_columns(channel_layout.channels)
+        plan.append(
+            _NodeColumns(
+                node_name,
+                pos_axes,
+                tuple(offset + i for i in pos_cols),
+                tuple(offset + i for i in rot_cols),
+                rot_order,
+            )
+        )
+        offset += channel_layout.channel_count
+    return tuple(plan)
+
+
+@functools.cache
+def _resolve_layout_columns(
+    channels: tuple[CHANNEL_TYPES, ...],
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...], str]:
+    """Layout-local position axes/columns, rotation columns and rotation order.
+
+    Files repeat a handful of layouts across all joints, so each distinct layout is resolved only once.
+    """
+    pos_axes: list[int] = []
+    pos_cols: list[int] = []
+    rot_cols: list[int] = []
+    rot_order = ""
+    for i, channel in enumerate(channels):
+        code = CHANNEL_CODES[channel]
+        if code < 3:
+            pos_axes.append(code)
+            pos_cols.append(i)
+        else:
+            rot_cols.append(i)
+            rot_order += "XYZ"[code - 3]
+    return tuple(pos_axes), tuple(pos_cols), tuple(rot_cols), rot_order
+
+
+def _find_line_end(buffer: bytes | mmap.mmap, pos: int) -> int:
+    """Return the offset of the first line break (LF or bare CR) at or after pos, or len(buffer)"""
+    ends = [end for end in (buffer.find(b"\n", pos), buffer.find(b"\r", pos)) if end != -1]
+    return min(ends) if ends else len(buffer)
+
+
+def _find_motion_line(buffer: bytes | mmap.mmap) -> int:
+    """Return the offset of the line consisting of the MOTION keyword, or -1 if there is none"""
+    # bytes.find/mmap.find run a C substring search; only candidate lines are inspected
+    pos = buffer.find(b"MOTION")
+    while pos != -1:
+        line_start = max(buffer.rfind(b"\n", 0, pos), buffer.rfind(b"\r", 0, pos)) + 1
+        line_end = _find_line_end(buffer, pos)
+        if buffer[line_start:line_end].strip() == b"MOTION":
+            return line_start
+        pos = buffer.find(b"MOTION", pos + 1)
+    return -1
+
+
+def _has_uniform_rows(frame_data: bytes, frame_count: int, expected_channels: int) -> bool:
+    """True if frame_data has exactly frame_count non-blank lines of expected_channels tokens each.
+
+    A matching total alone would let values shift across frames. Anything unusual, such as bare CR
+    line endings, returns False so the caller falls back to the line-by-line parser.
+    """
+    if frame_data.count(b"\r") > frame_data.count(b"\n"):
+        return False
+    buffer = np.frombuffer(frame_data, dtype=np.uint8)
+    is_token = buffer > ord(" ")  # Frame values never contain whitespace or control bytes
+    token_starts = np.flatnonzero(is_token[1:] & ~is_token[:-1]) + 1
+    if is_token[:1].any():
+        token_starts = np.concatenate(([0], token_starts))
+    # Tokens per line: differences of the token counts before each line break
+    line_breaks = np.flatnonzero(buffer == ord("\n"))
+    tokens_before = np.searchsorted(token_starts, line_breaks)
+    tokens_per_line = np.diff(tokens_before, prepend=0, append=token_starts.size)
+    tokens_per_line = tokens_per_line[tokens_per_line > 0]
+    return tokens_per_line.size == frame_count and bool(np.all(tokens_per_line == expected_channels))
+
+
+def _parse_frame_lines(frame_data: bytes, frame_count: int, expected_channels: int) -> NDArray[np.float64]:
+    """Parse frame data line by line, streaming raw doubles into an array.array buffer"""
+    values = array.array("d")
+    parsed_frames = 0
+    for frame_line in frame_data.splitlines():
+        tokens = frame_line.split()
+        if not tokens:
+            continue
+        try:
+            values.extend(map(float, tokens))
+        except ValueError as e:
+            raise ParseError(f"Invalid frame data at frame {parsed_frames}: {str(e)}")
+        if len(values) != (parsed_frames + 1) * expected_channels:
+            raise ParseError(f"Expected {expected_channels} values at frame {parsed_frames}, got {len(tokens)}")
+        parsed_frames += 1
+
+    if parsed_frames != frame_count:
+        raise ParseError(f"Frame count mismatch: expected {frame_count}, got {parsed_frames}")
+
+    # Zero-copy: the ndarray keeps the array.array buffer alive
+    return np.frombuffer(values, dtype=np.float64).reshape(frame_count, expected_channels)
+
+
+def _parse_node_line(
+    current_node_name: str | None, tokens: tuple[str, ...], line_number: int
+) -> tuple[str, str | None]:
+    """Parse a node declaration line into its name and parent name"""
+    if len(tokens) < 2:
+        raise ParseError(f"Missing node name at line {line_number}")
     node_type, node_name = tokens[0], tokens[1]
 
     if node_type == "ROOT" and current_node_name is not None:
-        raise ParseError("Multiple ROOT nodes are not allowed")
+        raise ParseError(f"Multiple ROOT nodes are not allowed at line {line_number}")
     elif node_type == "JOINT" and current_node_name is None:
-        raise ParseError("JOINT specified before ROOT is defined")
+        raise ParseError(f"JOINT specified before ROOT is defined at line {line_number}")
     elif node_type == "End":
         if current_node_name is None:
-            raise ParseError("End node specified before ROOT or JOINT is defined")
+            raise ParseError(f"End node specified before ROOT or JOINT is defined at line {line_number}")
         if node_name != "Site":
-            raise ParseError(f'"End {node_name}" is not a valid node type (expected "End Site")')
+            raise ParseError(f'"End {node_name}" is not a valid node type (expected "End Site") at line {line_number}')
         node_name = f"{current_node_name}_EndSite"
 
     parent_name = current_node_name if node_type != "ROOT" else None
-    return Node(name=node_name, parent_name=parent_name)
+    # Interned like Node names, so the motion mappings share key objects with the tree
+    return sys.intern(node_name), parent_name
 
 
-def _parse_offset_line(offset_tokens: list[str]) -> NDArray[np.float64]:
+def _parse_floats(data: bytes | str) -> NDArray[np.float64] | None:
+    """Parse whitespace-separated floats in one C pass, or return None if any token is not a number"""
+    with warnings.catch_warnings():
+        # Unparsable tokens only trigger a DeprecationWarning in np.fromstring; promote it to an error
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=np.float64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def _parse_offsets(owners: list[str], line_numbers: list[int], tokens: list[str]) -> dict[str, NDArray[np.float64]]:
+    """Parse all OFFSET values at once and return one row view per owning node"""
+    values = _parse_floats(" ".join(tokens))
+    if values is None or values.size != len(tokens):
+        # Slow path: accepts tokens only Python's float() understands, or reports the offending line
+        return {
+            owner: _parse_offset_line(tuple(tokens[3 * k : 3 * k + 3]), line_numbers[k])
+            for k, owner in enumerate(owners)
+        }
+    rows = values.reshape(len(owners), 3)
+    return {owner: rows[k] for k, owner in enumerate(owners)}
+
+
+def _parse_offset_line(offset_tokens: tuple[str, ...], line_number: int) -> NDArray[np.float64]:
     """Parse OFFSET line"""
     try:
         return np.array([float(x) for x in offset_tokens], dtype=np.float64)
     except ValueError:
-        raise ParseError(f"Invalid OFFSET values: {' '.join(offset_tokens)}")
+        raise ParseError(f"Invalid OFFSET values at line {line_number}: {' '.join(offset_tokens)}")
 
 
-def _parse_channels_line(tokens: list[str]) -> BVHChannelLayout:
+def _parse_channels_line(tokens: tuple[str, ...], line_number: int) -> BVHChannelLayout:
     """Parse CHANNELS line"""
     try:
         channel_count = int(tokens[1])
         channel_names = tokens[2:]
 
         if len(channel_names) != channel_count:
-            raise ParseError(f"Channel count mismatch: expected {channel_count}, got {len(channel_names)}")
+            raise ParseError(
+                f"Channel count mismatch at line {line_number}: expected {channel_count}, got {len(channel_names)}"
+            )
 
         validated_channels: list[CHANNEL_TYPES] = []
         for ch in channel_names:
             validated_channels.append(validate_channel(ch))
         return BVHChannelLayout.from_bvh_channels(tuple(validated_channels))
     except (ValueError, IndexError) as e:
-        raise ParseError(f"Invalid CHANNELS specification: {str(e)}")
+        raise ParseError(f"Invalid CHANNELS specification at line {line_number}: {str(e)}")
 
 
 def load_bvh(filename: str) -> MotionData:
@@ -242,46 +426,18 @@ def load_bvh(filename: str) -> MotionData:
     Raises:
         ParseError: When an error occurs while parsing the BVH file
     """
-    content = Path(filename).read_text()
-    return parse_bvh_content(content)
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ParseError("MOTION section not found in BVH file")
+        # Map the file instead of reading and decoding it all; only the hierarchy is decoded
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_bvh_content(mapped)
 
 
-def parse_bvh_content(content: str) -> MotionData:
+def parse_bvh_content(content: str | bytes | mmap.mmap) -> MotionData:
     """Pure functional BVH parsing pipeline"""
     sections_result = split_into_sections(content)
     parsed_hierarchy = parse_hierarchy_section(sections_result)
     parsed_motion = parse_motion_data(parsed_hierarchy, sections_result)
     motion = build_motion_data_efficiently(parsed_motion)
     return motion
-
-
-def _parse_channel_values(
-    channels: tuple[CHANNEL_TYPES, ...], values: tuple[float, ...]
-) -> tuple[NDArray[np.float64], R]:
-    """Parse channel values into position and rotation data."""
-    if len(channels) != len(values):
-        raise ParseError("Number of channels and values do not match")
-
-    position = np.zeros(3, dtype=np.float64)
-    rot_order = ""
-    rot_values: list[float] = []
-
-    for channel, value in zip(channels, values):
-        if channel == "Xposition":
-            position[0] = value
-        elif channel == "Yposition":
-            position[1] = value
-        elif channel == "Zposition":
-            position[2] = value
-        elif channel == "Xrotation":
-            rot_order += "X"
-            rot_values.append(value)
-        elif channel == "Yrotation":
-            rot_order += "Y"
-            rot_values.append(value)
-        elif channel == "Zrotation":
-            rot_order += "Z"
-            rot_values.append(value)
-
-    rotation = R.from_euler(rot_order, rot_values, degrees=True) if rot_order else R.identity()
-    return position, rotation
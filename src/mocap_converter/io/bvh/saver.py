@@ -1,12 +1,23 @@
+from typing import BinaryIO
+
 import numpy as np
 from numpy.typing import NDArray
 from scipy.spatial.transform import Rotation as R
 
 from mocap_converter.io.bvh.channel_layout import BVHChannelLayout
-from mocap_converter.io.bvh.types import CHANNEL_TYPES, NODE_TYPES
+from mocap_converter.io.bvh.types import CHANNEL_CODES, CHANNEL_TYPES, ROTATION_ORDER
 from mocap_converter.kinematic_tree import KinematicTree
 from mocap_converter.motion_data import MotionData
 
+_INDENT = "  "  # Indentation added per hierarchy level
+_ROWS_PER_WRITE = 1024  # Rows formatted per write; bounds the temporary string size
+
+# Default layouts keyed by "is root": root has XYZ positions; every node has ZXY rotations
+_DEFAULT_CHANNEL_LAYOUTS: dict[bool, BVHChannelLayout] = {
+    is_root: BVHChannelLayout.from_rotation_order(has_position_channels=is_root, rotation_order="ZXY")
+    for is_root in (True, False)
+}
+
 
 def save_bvh(
     motion_data: MotionData,
@@ -38,7 +49,9 @@ def save_bvh(
 
     motion_values = _extract_motion_values(node_order, motion_data, channel_layouts)
 
-    np.savetxt(filename, motion_values, delimiter=" ", header=header, comments="")
+    with open(filename, "wb") as f:
+        f.write(f"{header}\n".encode())
+        _write_motion_values(f, motion_values)
 
 
 def _get_channel_layout_for_node(
@@ -46,70 +59,57 @@ def _get_channel_layout_for_node(
     node_name: str,
     channel_layouts: dict[str, BVHChannelLayout],
 ) -> BVHChannelLayout:
-    node = tree.get_node(node_name)
-    explicit = channel_layouts.get(node.name)
+    explicit = channel_layouts.get(node_name)
     if explicit is not None:
         return explicit
 
-    return BVHChannelLayout.from_rotation_order(
-        has_position_channels=node.is_root,
-        rotation_order="ZXY",
-    )
+    return _DEFAULT_CHANNEL_LAYOUTS[tree.get_node(node_name).is_root]
 
 
-def _build_nodes_recursive(
+def _build_node_lines(
     tree: KinematicTree,
-    node_name: str,
+    root_name: str,
     channel_layouts: dict[str, BVHChannelLayout],
     node_order: list[str],
-    indent: str = "  ",
 ) -> list[str]:
-    """Recursively build BVH node strings and track channel order."""
-    node = tree.get_node(node_name)
-    channel_layout = _get_channel_layout_for_node(tree, node_name, channel_layouts)
+    """Build indented BVH node lines with an explicit depth-first stack and track channel order."""
+    lines: list[str] = []
+    indents = [""]  # indents[d] prefixes lines at depth d; grown on demand
+    # Entries are (node name, depth); a None name closes the node opened at that depth
+    stack: list[tuple[str | None, int]] = [(root_name, 0)]
 
-    children = tree.get_children(node_name)
-    if children:  # Joint/Root node with children
-        child_content: list[str] = []
-        node_order.append(node.name)
-        for child in children:
-            child_lines = _build_nodes_recursive(tree, child.name, channel_layouts, node_order, indent)
-            child_content.extend(child_lines)
-        node_type = "ROOT" if node.is_root else "JOINT"
+    while stack:
+        node_name, depth = stack.pop()
+        while len(indents) <= depth + 2:
+            indents.append(indents[-1] + _INDENT)
 
-        return _build_node_string(
-            node_type,
-            node.name,
-            node.offset,
-            channel_layout.channels,
-            child_content,
-            indent,
-        )
+        if node_name is None:
+            lines.append(indents[depth] + "}")
+            continue
+
+        node = tree.get_node(node_name)
+        children = tree.get_children(node_name)
+
+        if not children and not node.is_root and not tree.has_siblings(node_name):
+            # An end-effector with no siblings should be an End Site
+            _append_node_lines(lines, indents, depth, "End Site", node.offset)
+            lines.append(indents[depth] + "}")
+            continue
 
-    if node.is_root:  # Root node with no children
-        node_order.append(node.name)
-        return _build_node_string(
-            "ROOT",
-            node.name,
-            node.offset,
-            channel_layout.channels,
-            indent=indent,
-        )
-
-    # Non-root node with no children
-    if tree.has_siblings(node_name):
         node_order.append(node.name)
-        return _build_node_string(
-            "JOINT",
-            node.name,
-            node.offset,
-            channel_layout.channels,
-            children=_build_node_string("End", node.name, np.zeros(3), indent=indent),
-            indent=indent,
-        )
+        channel_layout = _get_channel_layout_for_node(tree, node_name, channel_layouts)
+        node_type = "ROOT" if node.is_root else "JOINT"
+        _append_node_lines(lines, indents, depth, f"{node_type} {node.name}", node.offset, channel_layout.channels)
+        stack.append((None, depth))
 
-    # An end-effector with no siblings should be an End Site
-    return _build_node_string("End", node.name, node.offset, indent=indent)
+        if children:
+            stack.extend((child.name, depth + 1) for child in reversed(children))
+        elif not node.is_root:
+            # A leaf joint with siblings keeps its channels and is closed by a zero-offset End Site
+            _append_node_lines(lines, indents, depth + 1, "End Site", np.zeros(3))
+            lines.append(indents[depth + 1] + "}")
+
+    return lines
 
 
 def _build_hierarchy_string(
@@ -123,7 +123,7 @@ def _build_hierarchy_string(
 
     ordered_node_names: list[str] = []
     lines = ["HIERARCHY"]
-    lines.extend(_build_nodes_recursive(kinematic_tree, root.name, channel_layouts, ordered_node_names))
+    lines.extend(_build_node_lines(kinematic_tree, root.name, channel_layouts, ordered_node_names))
     return "\n".join(lines), ordered_node_names
 
 
@@ -132,7 +132,7 @@ def _extract_motion_values(
 ) -> NDArray[np.float64]:
     """Extract motion values from motion data based on node channels."""
     kinematic_tree = motion_data.kinematic_tree
-    motion_values: list[NDArray[np.float64]] = []
+    node_layouts: list[tuple[str, BVHChannelLayout]] = []
 
     for node_name in node_order:
         channel_layout = _get_channel_layout_for_node(kinematic_tree, node_name, channel_layouts)
@@ -143,20 +143,46 @@ def _extract_motion_values(
         if channel_layout.has_rotation_channels and not motion_data.has_rotations(node_name):
             raise ValueError(f"Rotation channels declared for '{node_name}' but no rotation data present in MotionData")
 
+        node_layouts.append((node_name, channel_layout))
+
+    total_channels = sum(channel_layout.channel_count for _, channel_layout in node_layouts)
+    if total_channels == 0:
+        raise ValueError("No motion data found to save")
+
+    # Fill column ranges of one preallocated matrix instead of concatenating per-node blocks
+    motion_values = np.empty((motion_data.frame_count, total_channels), dtype=np.float64)
+    col = 0
+    for node_name, channel_layout in node_layouts:
         if channel_layout.has_position_channels:
-            positions = motion_data.positions[node_name]  # (frames, 3)
-            motion_values.append(positions)
+            axes = [CHANNEL_CODES[channel] for channel in channel_layout.position_channels]
+            motion_values[:, col : col + len(axes)] = motion_data.positions[node_name][:, axes]  # (frames, <=3)
+            col += len(axes)
         if channel_layout.has_rotation_channels:
-            rotations = motion_data.rotations[node_name]
-            euler_rotations = R.from_quat(rotations).as_euler(
-                channel_layout.rotation_order, degrees=True
+            motion_values[:, col : col + 3] = _euler_angles_for_node(
+                motion_data, node_name, channel_layout.rotation_order
             )  # (frames, 3)
-            motion_values.append(euler_rotations)
+            col += 3
+
+    return motion_values  # (frames, num_channels)
+
+
+def _euler_angles_for_node(
+    motion_data: MotionData, node_name: str, rotation_order: ROTATION_ORDER
+) -> NDArray[np.float64]:
+    """Euler angles in degrees, reusing the source angles when they were loaded in the same order."""
+    source = motion_data.source_euler(node_name)
+    if source is not None and source[0] == rotation_order:
+        return source[1]
+    return R.from_quat(motion_data.rotations[node_name]).as_euler(rotation_order, degrees=True)
 
-    if not motion_values:
-        raise ValueError("No motion data found to save")
 
-    return np.concatenate(motion_values, axis=1)  # (frames, num_channels)
+def _write_motion_values(f: BinaryIO, motion_values: NDArray[np.float64]) -> None:
+    """Write motion rows as "%.6f" values, formatting a block of rows per % operation."""
+    frame_count, channel_count = motion_values.shape
+    row_format = " ".join(["%.6f"] * channel_count) + "\n"
+    for start in range(0, frame_count, _ROWS_PER_WRITE):
+        block = motion_values[start : start + _ROWS_PER_WRITE]
+        f.write((row_format * len(block) % tuple(block.ravel().tolist())).encode())
 
 
 def _build_motion_info_string(motion_data: MotionData) -> str:
@@ -164,27 +190,19 @@ def _build_motion_info_string(motion_data: MotionData) -> str:
     return f"MOTION\nFrames: {motion_data.frame_count}\nFrame Time: {motion_data.frame_time:.6f}"
 
 
-def _build_node_string(
-    node_type: NODE_TYPES,
-    node_name: str,
+def _append_node_lines(
+    lines: list[str],
+    indents: list[str],
+    depth: int,
+    header: str,
     offset: NDArray[np.float64],
-    channels: tuple[CHANNEL_TYPES, ...] | None = None,
-    children: list[str] | None = None,
-    indent: str = "  ",
-) -> list[str]:
-    """Build string representation of a single BVH node."""
-    lines: list[str] = []
-    if node_type == "End":
-        lines.append("End Site")
-    else:
-        lines.append(f"{node_type} {node_name}")
-    lines.append("{")
-
-    lines.append(indent + f"OFFSET {offset[0]:.6f} {offset[1]:.6f} {offset[2]:.6f}")
+    channels: tuple[CHANNEL_TYPES, ...] = (),
+) -> None:
+    """Append the header, opening brace, OFFSET and CHANNELS lines of a node at the given depth."""
+    indent = indents[depth]
+    inner = indents[depth + 1]
+    lines.append(indent + header)
+    lines.append(indent + "{")
+    lines.append(inner + f"OFFSET {offset[0]:.6f} {offset[1]:.6f} {offset[2]:.6f}")
     if channels:
-        lines.append(indent + f"CHANNELS {len(channels)} {' '.join(channels)}")
-    if children:
-        lines.extend([indent + line for line in children])
-
-    lines.append("}")
-    return lines
+        lines.append(inner + f"CHANNELS {len(channels)} {' '.join(channels)}")
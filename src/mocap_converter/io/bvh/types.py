@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, cast
 
 # Typed aliases for BVH constructs
 
@@ -26,6 +26,20 @@ _ROTATION_ORDER_BY_CHANNELS: dict[tuple[ROTATION_CHANNELS, ...], ROTATION_ORDER]
     v: k for k, v in _ROTATION_CHANNELS_BY_ORDER.items()
 }
 
+_POSITION_CHANNELS: frozenset[str] = frozenset(("Xposition", "Yposition", "Zposition"))
+_ROTATION_CHANNELS: frozenset[str] = frozenset(("Xrotation", "Yrotation", "Zrotation"))
+_VALID_CHANNELS: frozenset[str] = _POSITION_CHANNELS | _ROTATION_CHANNELS
+
+# Integer code per channel: 0-2 are X/Y/Z positions, 3-5 are X/Y/Z rotations
+CHANNEL_CODES: dict[CHANNEL_TYPES, int] = {
+    "Xposition": 0,
+    "Yposition": 1,
+    "Zposition": 2,
+    "Xrotation": 3,
+    "Yrotation": 4,
+    "Zrotation": 5,
+}
+
 
 def rotation_channels_from_order(order: ROTATION_ORDER) -> tuple[ROTATION_CHANNELS, ...]:
     return _ROTATION_CHANNELS_BY_ORDER[order]
@@ -39,21 +53,18 @@ def rotation_order_from_channels(chs: tuple[ROTATION_CHANNELS, ...]) -> ROTATION
 
 
 def validate_channel(channel: str) -> CHANNEL_TYPES:
-    if channel in ("Xposition", "Yposition", "Zposition"):
-        return channel
-    elif channel in ("Xrotation", "Yrotation", "Zrotation"):
-        return channel
-    else:
-        raise ValueError(f"Invalid channel: {channel}")
+    if channel in _VALID_CHANNELS:
+        return cast(CHANNEL_TYPES, channel)
+    raise ValueError(f"Invalid channel: {channel}")
 
 
 def filter_position_channels(
     channels: tuple[CHANNEL_TYPES, ...],
 ) -> tuple[POSITION_CHANNELS, ...]:
-    return tuple(ch for ch in channels if ch in ("Xposition", "Yposition", "Zposition"))
+    return tuple(cast(POSITION_CHANNELS, ch) for ch in channels if ch in _POSITION_CHANNELS)
 
 
 def filter_rotation_channels(
     channels: tuple[CHANNEL_TYPES, ...],
 ) -> tuple[ROTATION_CHANNELS, ...]:
-    return tuple(ch for ch in channels if ch in ("Xrotation", "Yrotation", "Zrotation"))
+    return tuple(cast(ROTATION_CHANNELS, ch) for ch in channels if ch in _ROTATION_CHANNELS)
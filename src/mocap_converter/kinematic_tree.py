@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from functools import cached_property
+from typing import Iterable
 
 import numpy as np
+from numpy.typing import NDArray
 
 from mocap_converter.node import Node
 
@@ -26,6 +29,15 @@ class KinematicTree:
     """
 
     nodes: dict[str, Node] = field(default_factory=dict[str, Node])
+    # Set by internal constructors that pass a freshly built dict nobody else references
+    _skip_copy: bool = field(default=False, kw_only=True, repr=False, compare=False)
+    # Set by internal operations whose result is valid whenever the source tree is
+    _skip_validation: bool = field(default=False, kw_only=True, repr=False, compare=False)
+
+    # Derived adjacency, built once per tree since the structure never changes
+    _children_index: dict[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _depths: dict[str, int] = field(init=False, repr=False, compare=False)
+    _root: Node | None = field(init=False, repr=False, compare=False)
 
     class NoRootError(Exception):
         """Raised when the kinematic tree has no root node."""
@@ -38,26 +50,37 @@ class KinematicTree:
 
     def __post_init__(self) -> None:
         """Validate the tree structure after initialization."""
-        object.__setattr__(self, "nodes", self.nodes.copy())
-        self._validate_tree_structure()
+        if not self._skip_copy:
+            object.__setattr__(self, "nodes", self.nodes.copy())
+        # The single scan for roots serves both validation and the root property
+        root_nodes = [node for node in self.nodes.values() if node.is_root]
+        object.__setattr__(self, "_root", root_nodes[0] if root_nodes else None)
+        if not self._skip_validation:
+            self._validate_tree_structure(root_nodes)
+        object.__setattr__(self, "_children_index", self._build_children_index())
+        object.__setattr__(self, "_depths", self._build_depths())
+        if not self._skip_validation:
+            self._validate_reachability()
 
     @classmethod
-    def from_nodes(cls, nodes: list[Node]) -> KinematicTree:
+    def from_nodes(cls, nodes: list[Node], *, validate: bool = True) -> KinematicTree:
         """Create a KinematicTree from a list of nodes.
 
         Args:
             nodes: List of Node instances to include in the tree.
+            validate: Check roots, parent links and cycles. Pass False only for nodes known to form
+                a valid tree, e.g. nodes copied from another KinematicTree with the same links.
 
         Returns:
             A new KinematicTree instance.
 
         Raises:
-            NoRootError: If no root node is found.
-            NotConnectedError: If multiple root nodes exist or nodes are not connected.
-            CircularReferenceError: If circular references are detected.
+            NoRootError: If no root node is found (only when validating).
+            NotConnectedError: If multiple root nodes exist or nodes are not connected (only when validating).
+            CircularReferenceError: If circular references are detected (only when validating).
         """
         node_dict = {node.name: node for node in nodes}
-        return cls(nodes=node_dict)
+        return cls(nodes=node_dict, _skip_copy=True, _skip_validation=not validate)
 
     @classmethod
     def from_params(cls, node_params: list[Node.NodeParams]) -> KinematicTree:
@@ -73,64 +96,69 @@ class KinematicTree:
             NoRootError: If no root node is found.
             NotConnectedError: If multiple root nodes exist.
         """
-        root_params = [p for p in node_params if not p.get("parent_name")]
-        if len(root_params) == 0:
-            raise cls.NoRootError("No root node found in node parameters")
-        if len(root_params) > 1:
-            raise cls.NotConnectedError("Multiple root nodes found")
-
-        nodes: list[Node] = []
+        # Count roots while building the nodes, so the parameters are walked only once
+        root_count = 0
+        node_dict: dict[str, Node] = {}
         for params in node_params:
+            parent_name = params.get("parent_name")
+            if not parent_name:
+                root_count += 1
             offset = params.get("offset")
-            if offset is None:
-                offset = np.zeros(3, dtype=np.float64)
-
-            node = Node(
-                name=params["name"],
-                parent_name=params.get("parent_name"),
-                offset=offset,
+            node = (
+                Node(name=params["name"], parent_name=parent_name)
+                if offset is None
+                else Node(name=params["name"], parent_name=parent_name, offset=offset)
             )
-            nodes.append(node)
+            node_dict[node.name] = node
+
+        if root_count == 0:
+            raise cls.NoRootError("No root node found in node parameters")
+        if root_count > 1:
+            raise cls.NotConnectedError("Multiple root nodes found")
 
-        return cls.from_nodes(nodes)
+        return cls(nodes=node_dict, _skip_copy=True)
 
-    def _validate_tree_structure(self) -> None:
+    def _build_children_index(self) -> dict[str, tuple[str, ...]]:
+        """Map every node name to its children's names in one pass over the nodes."""
+        children: dict[str, list[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            if node.parent_name is not None:
+                children[node.parent_name].append(node.name)
+        return {name: tuple(child_names) for name, child_names in children.items()}
+
+    def _build_depths(self) -> dict[str, int]:
+        """Assign every node its depth with one breadth-first walk from the root."""
+        if self.root is None:
+            return {}
+        depths = {self.root.name: 0}
+        queue = [self.root.name]
+        for name in queue:  # The queue grows while it is iterated
+            for child_name in self._children_index[name]:
+                depths[child_name] = depths[name] + 1
+                queue.append(child_name)
+        return depths
+
+    def _validate_tree_structure(self, root_nodes: list[Node]) -> None:
         """Validate the tree structure for consistency."""
         if not self.nodes:
             return
 
-        # Find root nodes
-        root_nodes = [node for node in self.nodes.values() if node.is_root]
         if len(root_nodes) == 0:
             raise self.NoRootError("No root node found in the tree")
         if len(root_nodes) > 1:
             raise self.NotConnectedError(f"Multiple root nodes found: {[n.name for n in root_nodes]}")
 
-        # Check for orphaned nodes and circular references
-        visited: set[str] = set()
+        # Orphans: every non-root node must name an existing parent
         for node in self.nodes.values():
-            if node.name in visited:
-                continue
-            self._check_path_to_root(node.name, set(), visited)
+            if node.parent_name is not None and node.parent_name not in self.nodes:
+                raise self.NotConnectedError(f"Parent '{node.parent_name}' of node '{node.name}' not found")
 
-    def _check_path_to_root(self, node_name: str, path: set[str], visited: set[str]) -> None:
-        """Check if a node has a valid path to root without cycles."""
-        if node_name in path:
-            raise self.CircularReferenceError(f"Circular reference detected involving node '{node_name}'")
-
-        if node_name in visited:
-            return
-
-        visited.add(node_name)
-        node = self.nodes.get(node_name)
-        if node is None:
-            raise self.NotConnectedError(f"Node '{node_name}' referenced but not found in tree")
-
-        if node.parent_name is not None:
-            if node.parent_name not in self.nodes:
-                raise self.NotConnectedError(f"Parent '{node.parent_name}' of node '{node_name}' not found")
-            new_path = path | {node_name}
-            self._check_path_to_root(node.parent_name, new_path, visited)
+    def _validate_reachability(self) -> None:
+        """Check that the breadth-first walk from the root reached every node."""
+        # With a single root and no orphans, any node the walk missed lies on a parent cycle
+        for name in self.nodes:
+            if name not in self._depths:
+                raise self.CircularReferenceError(f"Circular reference detected involving node '{name}'")
 
     def get_node(self, name: str) -> Node:
         """Get a node by name.
@@ -144,9 +172,10 @@ class KinematicTree:
         Raises:
             KeyError: If the node is not found.
         """
-        if name not in self.nodes:
+        node = self.nodes.get(name)
+        if node is None:
             raise KeyError(f"Node '{name}' not found in the kinematic tree")
-        return self.nodes[name]
+        return node
 
     def get_parent(self, node_name: str) -> Node | None:
         """Get the parent of a node.
@@ -169,7 +198,7 @@ class KinematicTree:
         Returns:
             A list of child Node instances.
         """
-        return [node for node in self.nodes.values() if node.parent_name == node_name]
+        return [self.nodes[child_name] for child_name in self._children_index.get(node_name, ())]
 
     def get_siblings(self, node_name: str) -> list[Node]:
         """Get all siblings of a node.
@@ -183,13 +212,34 @@ class KinematicTree:
         parent_node = self.get_parent(node_name)
         if parent_node is None:
             return []
-        return [node for node in self.nodes.values() if node.parent_name == parent_node.name and node.name != node_name]
+        return [self.nodes[name] for name in self._children_index[parent_node.name] if name != node_name]
 
-    @cached_property
+    @property
     def root(self) -> Node | None:
         """Get the root node of the tree."""
-        root_nodes = [node for node in self.nodes.values() if node.is_root]
-        return root_nodes[0] if root_nodes else None
+        return self._root
+
+    @cached_property
+    def topological_order(self) -> tuple[str, ...]:
+        """Node names in breadth-first order from the root, so every parent precedes its children."""
+        return tuple(self._depths)
+
+    @cached_property
+    def parent_indices(self) -> NDArray[np.int32]:
+        """Index of each node's parent in topological_order (-1 for the root), aligned with it.
+
+        Lets per-joint passes such as forward kinematics gather parent results by index::
+
+            parents = tree.parent_indices
+            for j in range(1, len(tree)):
+                world[:, j] = compose(world[:, parents[j]], local[:, j])
+        """
+        order = self.topological_order
+        index = {name: i for i, name in enumerate(order)}
+        parent_names = [self.nodes[name].parent_name for name in order]
+        parents = np.array([-1 if p is None else index[p] for p in parent_names], dtype=np.int32)
+        parents.setflags(write=False)
+        return parents
 
     def has_children(self, node_name: str) -> bool:
         """Check if a node has children.
@@ -200,7 +250,7 @@ class KinematicTree:
         Returns:
             True if the node has children, False otherwise.
         """
-        return any(node.parent_name == node_name for node in self.nodes.values())
+        return bool(self._children_index.get(node_name))
 
     def is_leaf(self, node_name: str) -> bool:
         """Check if a node is a leaf (has no children).
@@ -225,7 +275,89 @@ class KinematicTree:
         parent_node = self.get_parent(node_name)
         if parent_node is None:
             return False
-        return any(sibling.name != node_name for sibling in self.get_children(parent_node.name))
+        # The parent's child list always contains the node itself
+        return len(self._children_index[parent_node.name]) > 1
+
+    @cached_property
+    def _nested_set(self) -> tuple[tuple[str, ...], dict[str, tuple[int, int]]]:
+        """Pre-order node names and each node's [start, end) interval of its subtree in that order."""
+        if self.root is None:
+            return (), {}
+        preorder: list[str] = []
+        intervals: dict[str, tuple[int, int]] = {}
+        # Entries are (node name, entered); a node is closed once all its descendants are numbered
+        stack = [(self.root.name, False)]
+        while stack:
+            name, entered = stack.pop()
+            if entered:
+                intervals[name] = (intervals[name][0], len(preorder))
+                continue
+            intervals[name] = (len(preorder), -1)
+            preorder.append(name)
+            stack.append((name, True))
+            stack.extend((child_name, False) for child_name in reversed(self._children_index[name]))
+        return tuple(preorder), intervals
+
+    def get_descendants(self, node_name: str) -> list[Node]:
+        """Get all descendants of a node in depth-first pre-order.
+
+        Args:
+            node_name: The name of the node.
+
+        Returns:
+            A list of descendant Node instances, excluding the node itself.
+
+        Raises:
+            KeyError: If the node is not found.
+        """
+        preorder, intervals = self._nested_set
+        start, end = self._interval(intervals, node_name)
+        return [self.nodes[name] for name in preorder[start + 1 : end]]
+
+    def get_ancestors(self, node_name: str) -> list[Node]:
+        """Get all ancestors of a node, from its parent up to the root.
+
+        Args:
+            node_name: The name of the node.
+
+        Returns:
+            A list of ancestor Node instances, excluding the node itself; its length is the node's depth.
+
+        Raises:
+            KeyError: If the node is not found.
+        """
+        ancestors: list[Node] = []
+        parent_name = self.get_node(node_name).parent_name
+        while parent_name is not None:
+            parent = self.nodes[parent_name]
+            ancestors.append(parent)
+            parent_name = parent.parent_name
+        return ancestors
+
+    def is_ancestor(self, ancestor_name: str, node_name: str) -> bool:
+        """Check if a node is a proper ancestor of another node.
+
+        Args:
+            ancestor_name: The name of the candidate ancestor.
+            node_name: The name of the node.
+
+        Returns:
+            True if node_name lies in the subtree below ancestor_name, False otherwise.
+
+        Raises:
+            KeyError: If either node is not found.
+        """
+        _, intervals = self._nested_set
+        start, end = self._interval(intervals, ancestor_name)
+        position = self._interval(intervals, node_name)[0]
+        return start < position < end
+
+    @staticmethod
+    def _interval(intervals: dict[str, tuple[int, int]], node_name: str) -> tuple[int, int]:
+        interval = intervals.get(node_name)
+        if interval is None:
+            raise KeyError(f"Node '{node_name}' not found in the kinematic tree")
+        return interval
 
     def get_depth(self, node_name: str) -> int:
         """Get the depth of a node in the tree.
@@ -235,18 +367,14 @@ class KinematicTree:
 
         Returns:
             The depth of the node (0 for root).
-        """
-        depth = 0
-        current_name = node_name
 
-        while True:
-            node = self.get_node(current_name)
-            if node.parent_name is None:
-                break
-            current_name = node.parent_name
-            depth += 1
-
-        return depth
+        Raises:
+            KeyError: If the node is not found.
+        """
+        try:
+            return self._depths[node_name]
+        except KeyError:
+            raise KeyError(f"Node '{node_name}' not found in the kinematic tree") from None
 
     def copy_with(
         self,
@@ -275,7 +403,23 @@ class KinematicTree:
         """
         new_nodes = self.nodes.copy()
         new_nodes[node.name] = node
-        return KinematicTree(nodes=new_nodes)
+        return KinematicTree(nodes=new_nodes, _skip_copy=True)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> KinematicTree:
+        """Create a new tree with several additional nodes, validated once.
+
+        Chaining add_node rebuilds and revalidates the tree per node; this adds them all first.
+        Nodes may come in any order as long as the finished tree is connected.
+
+        Args:
+            nodes: The nodes to add.
+
+        Returns:
+            A new KinematicTree instance with the nodes added.
+        """
+        new_nodes = self.nodes.copy()
+        new_nodes.update((node.name, node) for node in nodes)
+        return KinematicTree(nodes=new_nodes, _skip_copy=True)
 
     def remove_node(self, name: str) -> KinematicTree:
         """Create a new tree without a specified node and its descendants.
@@ -288,21 +432,25 @@ class KinematicTree:
         """
         if name not in self.nodes:
             raise KeyError(f"Node '{name}' not found in the kinematic tree")
+        if self._root is not None and name == self._root.name:
+            # Every node descends from the root, so nothing is left
+            return KinematicTree()
 
         # Find all nodes to remove (node and its descendants)
         nodes_to_remove = {name}
-        queue = [name]
+        queue = deque([name])
 
         while queue:
-            current = queue.pop(0)
-            for child in self.get_children(current):
-                if child not in nodes_to_remove:
-                    nodes_to_remove.add(child.name)
-                    queue.append(child.name)
+            current = queue.popleft()
+            for child_name in self._children_index[current]:
+                if child_name not in nodes_to_remove:
+                    nodes_to_remove.add(child_name)
+                    queue.append(child_name)
 
         # Create new nodes dictionary without removed nodes
         new_nodes = {n: node for n, node in self.nodes.items() if n not in nodes_to_remove}
-        return KinematicTree(nodes=new_nodes)
+        # Dropping a whole subtree keeps the root and every remaining parent link intact
+        return KinematicTree(nodes=new_nodes, _skip_copy=True, _skip_validation=True)
 
     def __len__(self) -> int:
         """Get the number of nodes in the tree."""
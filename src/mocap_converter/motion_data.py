@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Mapping
+from typing import Mapping, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
@@ -30,18 +30,26 @@ def _freeze_mapping(
 
 def _validate_mapping_nodes(
     tree: KinematicTree, data: Mapping[str, NDArray[np.float64]] | None
-) -> dict[str, NDArray[np.float64]]:
+) -> Mapping[str, NDArray[np.float64]]:
     """Validate that all mapping keys exist in the kinematic tree.
 
-    Returns a shallow-copied dict to decouple from the caller while keeping
-    array objects for subsequent freezing step.
+    Returns the mapping unchanged; the subsequent freezing step builds the
+    decoupled copy, so no intermediate shallow copy is made here.
     """
     if not data:
         return {}
-    for name in data.keys():
-        if name not in tree.nodes:
-            raise KeyError(f"Unknown node '{name}' not found in kinematic tree")
-    return dict(data)
+    # One set difference over the key views instead of a membership test per key
+    if data.keys() - tree.nodes.keys():
+        name = next(name for name in data if name not in tree.nodes)
+        raise KeyError(f"Unknown node '{name}' not found in kinematic tree")
+    return data
+
+
+def _validate_frames_against(data: Mapping[str, NDArray[np.float64]], frame_count: int, *, kind: str) -> None:
+    """Raise ValueError when any node's frame count differs from frame_count."""
+    for name, arr in data.items():
+        if arr.shape[0] != frame_count:
+            raise ValueError(f"{kind} data for '{name}' must have same frames: {arr.shape[0]} vs {frame_count}")
 
 
 def _infer_and_validate_frame_count(
@@ -55,27 +63,44 @@ def _infer_and_validate_frame_count(
     """
     frame_count = 0
     if len(pos_map) > 0:
-        first = next(iter(pos_map.values()))
-        frame_count = first.shape[0]
-        for name, arr in pos_map.items():
-            if arr.shape[0] != frame_count:
-                raise ValueError(f"Position data for '{name}' must have same frames: {arr.shape[0]} vs {frame_count}")
+        frame_count = next(iter(pos_map.values())).shape[0]
+        _validate_frames_against(pos_map, frame_count, kind="Position")
     if len(rot_map) > 0:
         if frame_count == 0:
-            first = next(iter(rot_map.values()))
-            frame_count = first.shape[0]
-        for name, arr in rot_map.items():
-            if arr.shape[0] != frame_count:
-                raise ValueError(f"Rotation data for '{name}' must have same frames: {arr.shape[0]} vs {frame_count}")
+            frame_count = next(iter(rot_map.values())).shape[0]
+        _validate_frames_against(rot_map, frame_count, kind="Rotation")
     return int(frame_count)
 
 
+def _freeze_source_euler(
+    data: Mapping[str, tuple[str, NDArray[np.float64]]] | None,
+    rot_map: Mapping[str, NDArray[np.float64]],
+) -> MappingProxyType[str, tuple[str, NDArray[np.float64]]]:
+    """Freeze source Euler angles, keeping only entries that describe a node's rotations."""
+    if not data:
+        return MappingProxyType({})
+    frozen: dict[str, tuple[str, NDArray[np.float64]]] = {}
+    for name, (order, angles) in data.items():
+        rotations = rot_map.get(name)
+        if rotations is None:
+            raise KeyError(f"Source Euler angles given for '{name}' without rotation data")
+        euler = _freeze_array(angles, shape_second=len(order))
+        if euler.shape[0] != rotations.shape[0]:
+            raise ValueError(
+                f"Source Euler angles for '{name}' must have same frames: {euler.shape[0]} vs {rotations.shape[0]}"
+            )
+        frozen[name] = (order, euler)
+    return MappingProxyType(frozen)
+
+
 @dataclass(frozen=True)
 class MotionData:
     """Immutable carrier of motion data.
 
     - positions: per-node arrays of shape (frames, 3), float64
     - rotations: per-node arrays of shape (frames, 4), float64 (xyzw quaternion)
+    - source_euler: optional per-node (rotation order, degrees (frames, len(order))) the rotations
+      were converted from; lets savers write unchanged rotations back without re-deriving Euler angles
     - All arrays are marked read-only; mappings are MappingProxyType
     """
 
@@ -86,6 +111,9 @@ class MotionData:
     _positions: MappingProxyType[str, NDArray[np.float64]] = field(init=False, repr=False)
     _rotations: MappingProxyType[str, NDArray[np.float64]] = field(init=False, repr=False)
     _frame_count: int = field(init=False, repr=False)
+    _source_euler: MappingProxyType[str, tuple[str, NDArray[np.float64]]] = field(init=False, repr=False)
+    # Most recent get_rotations_stack result, keyed by its node order
+    _rotations_stack: tuple[tuple[str, ...], NDArray[np.float64]] | None = field(init=False, repr=False, compare=False)
 
     def __init__(
         self,
@@ -93,6 +121,8 @@ class MotionData:
         positions: Mapping[str, NDArray[np.float64]] | None = None,
         rotations: Mapping[str, NDArray[np.float64]] | None = None,
         frame_time: float = 1 / 30,
+        *,
+        source_euler: Mapping[str, tuple[str, NDArray[np.float64]]] | None = None,
     ) -> None:
         object.__setattr__(self, "kinematic_tree", kinematic_tree)
         object.__setattr__(self, "frame_time", float(frame_time))
@@ -107,6 +137,29 @@ class MotionData:
         object.__setattr__(self, "_positions", pos_map)
         object.__setattr__(self, "_rotations", rot_map)
         object.__setattr__(self, "_frame_count", int(frame_count))
+        object.__setattr__(self, "_source_euler", _freeze_source_euler(source_euler, rot_map))
+        object.__setattr__(self, "_rotations_stack", None)
+
+    @classmethod
+    def _from_frozen(
+        cls,
+        kinematic_tree: KinematicTree,
+        positions: MappingProxyType[str, NDArray[np.float64]],
+        rotations: MappingProxyType[str, NDArray[np.float64]],
+        frame_time: float,
+        frame_count: int,
+        source_euler: MappingProxyType[str, tuple[str, NDArray[np.float64]]],
+    ) -> "MotionData":
+        """Assemble an instance from state that is already validated and frozen, skipping __init__."""
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "kinematic_tree", kinematic_tree)
+        object.__setattr__(instance, "frame_time", frame_time)
+        object.__setattr__(instance, "_positions", positions)
+        object.__setattr__(instance, "_rotations", rotations)
+        object.__setattr__(instance, "_frame_count", frame_count)
+        object.__setattr__(instance, "_source_euler", source_euler)
+        object.__setattr__(instance, "_rotations_stack", None)
+        return instance
 
     @property
     def frame_count(self) -> int:
@@ -128,6 +181,34 @@ class MotionData:
         """Read-only mapping of all node rotations (frames x 4, quaternion xyzw). Arrays are write-protected."""
         return self._rotations
 
+    def get_rotations_stack(self, order: Sequence[str] | None = None) -> NDArray[np.float64]:
+        """Rotations of several nodes stacked into one contiguous read-only array.
+
+        The result for the most recent order is cached, so repeated whole-skeleton sweeps stack only once.
+        Args:
+            order: Node names to stack, each with rotation data (default: all rotated nodes in mapping order).
+        Returns:
+            Quaternions (shape: (len(order), frames, 4)) in xyzw format.
+        """
+        key = tuple(self._rotations) if order is None else tuple(order)
+        cached = self._rotations_stack
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        missing = [name for name in key if name not in self._rotations]
+        if missing:
+            raise KeyError(f"No rotation data for node '{missing[0]}'")
+        stack = np.empty((len(key), self._frame_count, 4), dtype=np.float64)
+        for row, name in enumerate(key):
+            stack[row] = self._rotations[name]
+        stack.setflags(write=False)
+        object.__setattr__(self, "_rotations_stack", (key, stack))
+        return stack
+
+    def source_euler(self, name: str) -> tuple[str, NDArray[np.float64]] | None:
+        """Rotation order and Euler angles (degrees) the node's rotations were built from, if known."""
+        return self._source_euler.get(name)
+
     def copy_with(
         self,
         *,
@@ -148,27 +229,46 @@ class MotionData:
 
         # Prepare positions
         if positions is None:
-            new_pos_map: Mapping[str, NDArray[np.float64]] = self._positions
+            new_pos_map = self._positions
         else:
             validated_positions = _validate_mapping_nodes(self.kinematic_tree, positions)
             new_pos_map = _freeze_mapping(validated_positions, shape_second=3)
 
-        # Prepare rotations
+        # Prepare rotations; source Euler angles survive only for rotation arrays passed through unchanged
         if rotations is None:
-            new_rot_map: Mapping[str, NDArray[np.float64]] = self._rotations
+            new_rot_map = self._rotations
+            new_source_euler = self._source_euler
         else:
             validated_rotations = _validate_mapping_nodes(self.kinematic_tree, rotations)
             new_rot_map = _freeze_mapping(validated_rotations, shape_second=4)
-
-        # Validate combined frame count
-        _ = _infer_and_validate_frame_count(new_pos_map, new_rot_map)
+            new_source_euler = MappingProxyType(
+                {
+                    name: euler
+                    for name, euler in self._source_euler.items()
+                    if new_rot_map.get(name) is self._rotations[name]
+                }
+            )
+
+        # Validate the frame count; a reused non-empty map is already consistent, so only the new map is scanned
+        if positions is None and self._positions:
+            frame_count = self._frame_count
+            if rotations is not None:
+                _validate_frames_against(new_rot_map, frame_count, kind="Rotation")
+        elif rotations is None and self._rotations:
+            frame_count = _infer_and_validate_frame_count(new_pos_map, {}) or self._frame_count
+            if frame_count != self._frame_count:
+                _validate_frames_against(new_rot_map, frame_count, kind="Rotation")  # raises
+        else:
+            frame_count = _infer_and_validate_frame_count(new_pos_map, new_rot_map)
 
         new_frame_time = self.frame_time if frame_time is None else float(frame_time)
 
-        # Construct a fresh MotionData
-        return MotionData(
+        # Both maps are frozen at this point (reused or freshly frozen), so skip re-freezing them in __init__
+        return MotionData._from_frozen(
             self.kinematic_tree,
-            positions=new_pos_map,
-            rotations=new_rot_map,
-            frame_time=new_frame_time,
+            new_pos_map,
+            new_rot_map,
+            new_frame_time,
+            frame_count,
+            new_source_euler,
         )
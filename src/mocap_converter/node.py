@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Final, Literal, TypedDict
 
@@ -28,9 +29,25 @@ class _KeepCurrentType:
 
 _KEEP_CURRENT: Final = _KeepCurrentType()
 
+# Shared default offset; read-only, so nodes created without an offset need no allocation of their own
+_ZERO_OFFSET: Final = np.zeros(3, dtype=np.float64)
+_ZERO_OFFSET.setflags(write=False)
 
-@dataclass(frozen=True)
-class Node:
+
+def _intern(name: str) -> str:
+    # sys.intern rejects str subclasses such as numpy.str_; those are kept as given
+    return sys.intern(name) if type(name) is str else name
+
+
+class _HashSlot:
+    """Slot for Node's cached hash, kept out of the dataclass fields (fields(), asdict(), replace())."""
+
+    __slots__ = ("_hash",)
+    _hash: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class Node(_HashSlot):
     """An immutable node in a kinematic tree, representing a joint or an end effector.
 
     This class uses an immutable design pattern where any modifications return a new
@@ -42,7 +59,7 @@ class Node:
         name: The unique name of the node.
         parent_name: The name of the parent node, or None if this is a root node.
         rotation_order: The order of rotation axes (default: "XYZ").
-        offset: The 3D offset from the parent node (default: zero vector).
+        offset: The 3D offset from the parent node, read-only (default: a shared zero vector).
 
     Methods:
         copy_with: Create a new node with updated properties.
@@ -56,17 +73,27 @@ class Node:
     name: str
     parent_name: str | None = None
     # rotation_order: RotationOrder = "XYZ"
-    offset: NDArray[np.float64] = field(default_factory=lambda: np.zeros(3, dtype=np.float64))
+    offset: NDArray[np.float64] = field(default_factory=lambda: _ZERO_OFFSET)
 
     # Type alias for backward compatibility
     NodeParams = _RequiredNodeParams | _OptionalNodeParams
 
     def __post_init__(self) -> None:
-        # Ensure offset is a defensive copy and has correct shape
+        # Ensure offset has correct shape
         if self.offset.shape != (3,):
             raise ValueError(f"offset must have shape (3,), got {self.offset.shape}")
-        # Create a defensive copy to prevent external mutation
-        object.__setattr__(self, "offset", self.offset.copy())
+        # Always copy and freeze: a read-only caller array can be made writeable again by its owner.
+        # Only the shared default is reused; copy_with hands on a node's own offset via _with_offset
+        if self.offset is not _ZERO_OFFSET:
+            offset = self.offset.copy()
+            offset.setflags(write=False)
+            object.__setattr__(self, "offset", offset)
+        # Interned names make the tree's name-keyed lookups hit the identity fast path of str comparison
+        object.__setattr__(self, "name", _intern(self.name))
+        if self.parent_name is not None:
+            object.__setattr__(self, "parent_name", _intern(self.parent_name))
+        # Filled on first __hash__; fields never change after construction
+        object.__setattr__(self, "_hash", None)
 
     @property
     def is_root(self) -> bool:
@@ -101,21 +128,27 @@ class Node:
         new_parent_name = self.parent_name if isinstance(parent_name, _KeepCurrentType) else parent_name
         # new_rotation_order = rotation_order if rotation_order is not None else self.rotation_order
 
-        if offset is not None:
-            if offset.shape != (3,):
-                raise ValueError(f"offset must have shape (3,), got {offset.shape}")
-            new_offset = offset.copy()
-        else:
-            new_offset = self.offset.copy()  # self.offset is guaranteed to be NDArray after __post_init__
+        if offset is None:
+            # The current offset is a frozen copy owned by a node, so it is shared without another copy
+            return Node._with_offset(new_name, new_parent_name, self.offset)
 
         return Node(
             name=new_name,
             parent_name=new_parent_name,
             # rotation_order=new_rotation_order,
-            offset=new_offset,
+            offset=offset,
         )
 
+    @staticmethod
+    def _with_offset(name: str, parent_name: str | None, offset: NDArray[np.float64]) -> Node:
+        """Build a Node around an offset that is already frozen and owned by another Node."""
+        node = object.__new__(Node)
+        node.__setstate__((name, parent_name, offset))
+        return node
+
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Node):
             return NotImplemented
         return (
@@ -126,8 +159,25 @@ class Node:
         )
 
     def __hash__(self) -> int:
-        # return hash((self.name, self.parent_name, self.rotation_order, tuple(self.offset)))
-        return hash((self.name, self.parent_name, tuple(self.offset)))  # self.offset is NDArray after __post_init__
+        cached = self._hash
+        if cached is None:
+            # Python floats keep hash(-0.0) == hash(0.0), matching the np.array_equal comparison in __eq__
+            # cached = hash((self.name, self.parent_name, self.rotation_order, tuple(self.offset.tolist())))
+            cached = hash((self.name, self.parent_name, tuple(self.offset.tolist())))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def __getstate__(self) -> tuple[str, str | None, NDArray[np.float64]]:
+        # str hashes are salted per process, so the cached hash must not travel with a pickle
+        return (self.name, self.parent_name, self.offset)
+
+    def __setstate__(self, state: tuple[str, str | None, NDArray[np.float64]]) -> None:
+        name, parent_name, offset = state
+        offset.setflags(write=False)  # unpickled arrays are fresh and writeable
+        object.__setattr__(self, "name", _intern(name))
+        object.__setattr__(self, "parent_name", None if parent_name is None else _intern(parent_name))
+        object.__setattr__(self, "offset", offset)
+        object.__setattr__(self, "_hash", None)
 
     def __repr__(self) -> str:
         return f"Node(name='{self.name}', parent_name={self.parent_name!r})"
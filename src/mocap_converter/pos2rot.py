@@ -2,6 +2,7 @@ import numpy as np
 from numpy.typing import NDArray
 from scipy.spatial.transform import Rotation as R
 
+from mocap_converter import quaternion
 from mocap_converter.motion_data import MotionData
 
 
@@ -10,7 +11,7 @@ def get_align_rotations(
     initial_offset: NDArray[np.float64],
 ) -> R:
     """
-    Align local offsets to initial offsets using R.align_vectors.
+    Align local offsets to initial offsets, solving every frame at once.
     Args:
         local_offsets: normalized local offsets (shape: (n_frames, n_samples, 3)).
         initial_offset: normalized initial offset (shape: (n_samples, 3)).
@@ -18,16 +19,20 @@ def get_align_rotations(
         Rotations (shape: (n_frames, 4)) in quaternion format.
     """
     n_frames = local_offsets.shape[0]
-    rotations: list[R] = []
     from_vecs = initial_offset.reshape(-1, 3)  # Reshape to (n_samples, 3)
 
-    for i in range(n_frames):
-        to_vecs = local_offsets[i].reshape(-1, 3)  # Reshape to (n_samples, 3)
-        align_result = R.align_vectors(to_vecs, from_vecs)
-        rotation = align_result[0]  # (1, 4)
-        rotations.append(rotation)
+    if from_vecs.shape[0] == 1:  # A single vector pair has a closed-form minimal rotation for all frames
+        return R.from_quat(quaternion.from_vectors(from_vecs[0], local_offsets.reshape(n_frames, 3)))
 
-    return R.concatenate(rotations)
+    # Kabsch: the best rotation taking from_vecs onto each frame's vectors comes from one batched SVD
+    # of the (n_frames, 3, 3) cross-covariance stack, equivalent to per-frame R.align_vectors
+    to_vecs = local_offsets.reshape(n_frames, -1, 3)
+    covariance = np.einsum("si,fsj->fij", from_vecs, to_vecs)  # (n_frames, 3, 3)
+    u, _, vt = np.linalg.svd(covariance)
+    v = vt.transpose(0, 2, 1)
+    # Flip the least significant axis where the best orthogonal fit is a reflection
+    v[:, :, 2] *= np.sign(np.linalg.det(u) * np.linalg.det(vt))[:, np.newaxis]
+    return R.from_matrix(v @ u.transpose(0, 2, 1))
 
 
 def apply_rotations(
@@ -41,13 +46,10 @@ def apply_rotations(
     Returns:
         Rotated vectors (shape: (n, m, 3)).
     """
-
-    n, m, _ = vec.shape
-
-    vec = vec.reshape(n * m, 3)
-    rot = np.repeat(rot, m, axis=0)  # (n*m,4)
-    ans = R.from_quat(rot).apply(vec)  # (n*m,3)
-    return ans.reshape(n, m, 3)
+    # quaternion.rotate assumes unit quaternions; normalize like R.from_quat does
+    unit_rot = quaternion.normalize(rot)
+    # Broadcast each frame's quaternion over its m vectors instead of repeating it
+    return quaternion.rotate(unit_rot[:, np.newaxis, :], vec)
 
 
 def get_rotations_from_positions(
@@ -55,64 +57,48 @@ def get_rotations_from_positions(
     current_node_name: str,
     accum_rot: R | None = None,  # (n_frames, 3, 3) or (3, 3)
 ) -> dict[str, NDArray[np.float64]]:
-    if accum_rot is None:
-        accum_rot = R.identity(motion_data.frame_count)
-
     result: dict[str, NDArray[np.float64]] = {}
     tree = motion_data.kinematic_tree
-    children = tree.get_children(current_node_name)
-    children_count = len(children)
-
-    if children_count == 1:  # Joint has a child
-        child_node = children[0]
-        actual_offsets = motion_data.positions[child_node.name] - motion_data.positions[current_node_name]
-
-        initial_offset = child_node.offset  # (3,)
-        if np.linalg.norm(initial_offset) == 0:  # child_node is an end effector
-            result[current_node_name] = R.identity(motion_data.frame_count).as_quat()
-            return result
-
-        initial_offset = initial_offset / np.linalg.norm(initial_offset)
+    positions = motion_data.positions
+    identity = R.identity(motion_data.frame_count).as_quat()
+
+    # Pre-order walk with an explicit stack; the accumulated rotation travels as (n_frames, 3, 3) or (3, 3)
+    # matrices so that composing and applying it are plain matmuls. None stands for the identity, which
+    # lets the root level skip both products
+    stack: list[tuple[str, NDArray[np.float64] | None]] = [
+        (current_node_name, None if accum_rot is None else accum_rot.as_matrix())
+    ]
+    while stack:
+        node_name, accum_mat = stack.pop()
+        children = tree.get_children(node_name)
+        if not children:
+            result[node_name] = identity.copy()  # Callers get one writeable buffer per node
+            continue
 
-        local_offsets = accum_rot.apply(actual_offsets)  # (num_frames, 3) -> (num_frames, 3)
-        local_offsets = local_offsets / np.linalg.norm(local_offsets, axis=1)[:, np.newaxis]  # Normalize
-
-        rotations = get_align_rotations(local_offsets.reshape(-1, 1, 3), initial_offset)
-        result[current_node_name] = rotations.as_quat()
-
-        r = get_rotations_from_positions(
-            motion_data,
-            child_node.name,
-            rotations.inv() * accum_rot,
-        )
-        result.update(r)
-
-    elif children_count > 1:  # Joint has children
-        actual_offsets = [
-            (motion_data.positions[child_node.name] - motion_data.positions[current_node_name])
-            for child_node in children
-        ]  # (n_children, n_frames, 3)
         initial_offsets = np.array([child_node.offset for child_node in children])  # (n_children, 3)
-        initial_offsets = initial_offsets / np.linalg.norm(initial_offsets, axis=1)[:, np.newaxis]
-        local_offsets = apply_rotations(
-            accum_rot.as_quat(),  # (n_frames, 4)
-            np.array(actual_offsets).transpose(1, 0, 2),  # (n_frames, n_children, 3)
+        initial_norms = np.linalg.norm(initial_offsets, axis=1)
+        if len(children) == 1 and initial_norms[0] == 0:  # child_node is an end effector
+            result[node_name] = identity.copy()
+            continue
+        initial_offsets = initial_offsets / initial_norms[:, np.newaxis]
+
+        actual_offsets = np.stack(
+            [positions[child_node.name] - positions[node_name] for child_node in children], axis=1
         )  # (n_frames, n_children, 3)
-
-        # Get rotations for all frames
-        rotations = get_align_rotations(
-            local_offsets, initial_offsets
-        )  # (n_frames, n_children, 3), (n_children, 3) -> (n_frames, 4)
-        result[current_node_name] = rotations.as_quat()
-
-        for child_node in children:
-            r = get_rotations_from_positions(
-                motion_data,
-                child_node.name,
-                rotations.inv() * accum_rot,
-            )
-            result.update(r)
-    else:
-        result[current_node_name] = R.identity(motion_data.frame_count).as_quat()
+        if accum_mat is None:
+            local_offsets = actual_offsets
+        else:
+            local_offsets = actual_offsets @ np.swapaxes(accum_mat, -1, -2)  # accum_rot.apply per frame
+        if len(children) == 1:
+            quaternion.normalize(local_offsets, out=local_offsets)  # Owned buffer, normalized in place
+
+        rotations = get_align_rotations(local_offsets, initial_offsets)  # -> (n_frames, 4)
+        result[node_name] = rotations.as_quat()
+
+        # rotations.inv() * accum_rot: the inverse of a rotation matrix is its transpose
+        child_accum = np.swapaxes(rotations.as_matrix(), -1, -2)
+        if accum_mat is not None:
+            child_accum = child_accum @ accum_mat
+        stack.extend((child_node.name, child_accum) for child_node in reversed(children))
 
     return result
@@ -0,0 +1,132 @@
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+_AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2}
+
+
+def multiply(
+    p: NDArray[np.float64], q: NDArray[np.float64], out: NDArray[np.float64] | None = None
+) -> NDArray[np.float64]:
+    """Hamilton product of quaternions in scalar-last (xyzw) format.
+
+    Args:
+        p: Left quaternions (shape: (..., 4)).
+        q: Right quaternions (shape: (..., 4)), broadcastable against p.
+        out: Optional destination (shape: broadcast of p and q); must not overlap p or q.
+    Returns:
+        Products p * q (shape: broadcast of p and q).
+    """
+    px, py, pz, pw = p[..., 0], p[..., 1], p[..., 2], p[..., 3]
+    qx, qy, qz, qw = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    product = np.empty(np.broadcast_shapes(p.shape, q.shape), dtype=np.float64) if out is None else out
+    product[..., 0] = pw * qx + px * qw + py * qz - pz * qy
+    product[..., 1] = pw * qy - px * qz + py * qw + pz * qx
+    product[..., 2] = pw * qz + px * qy - py * qx + pz * qw
+    product[..., 3] = pw * qw - px * qx - py * qy - pz * qz
+    return product
+
+
+def normalize(a: NDArray[np.float64], out: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+    """Scale quaternions (or vectors) along the last axis to unit length.
+
+    One einsum for the squared lengths and one in-place sqrt, instead of np.linalg.norm plus a division.
+    Args:
+        a: Quaternions or vectors (shape: (..., k)).
+        out: Optional destination (shape: a.shape); may be a itself.
+    Returns:
+        Unit-length rows (shape: a.shape).
+    """
+    lengths = np.einsum("...i,...i->...", a, a)
+    np.sqrt(lengths, out=lengths)
+    return np.divide(a, lengths[..., np.newaxis], out=out)
+
+
+def rotate(q: NDArray[np.float64], v: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Rotate vectors by unit quaternions in scalar-last (xyzw) format.
+
+    Uses ``v' = v + w t + q_xyz x t`` with ``t = 2 q_xyz x v``, which avoids building rotation matrices.
+    Args:
+        q: Unit quaternions (shape: (..., 4)).
+        v: Vectors (shape: (..., 3)), broadcastable against q[..., :3].
+    Returns:
+        Rotated vectors (shape: broadcast of q[..., :3] and v).
+    """
+    q_xyz = q[..., :3]
+    t = 2.0 * np.cross(q_xyz, v)
+    return v + q[..., 3:] * t + np.cross(q_xyz, t)
+
+
+def from_euler(
+    seq: str, angles: ArrayLike, degrees: bool = False, out: NDArray[np.float64] | None = None
+) -> NDArray[np.float64]:
+    """Convert intrinsic Euler angles to quaternions without building scipy Rotation objects.
+
+    Equivalent to ``R.from_euler(seq, angles, degrees).as_quat()`` for uppercase sequences.
+    Args:
+        seq: Intrinsic rotation axes, e.g. "ZXY" (1 to 3 uppercase characters).
+        angles: Euler angles (shape: (n, len(seq))).
+        degrees: True if angles are given in degrees.
+        out: Optional destination (shape: (n, 4)), e.g. a view into a larger motion buffer.
+    Returns:
+        Quaternions (shape: (n, 4)) in xyzw format.
+    """
+    if not 1 <= len(seq) <= 3 or any(axis not in _AXIS_INDEX for axis in seq):
+        raise ValueError(f"Expected 1 to 3 intrinsic axes from 'XYZ', got '{seq}'")
+
+    angles_np = np.asarray(angles, dtype=np.float64).reshape(-1, len(seq))
+    if degrees:
+        angles_np = np.deg2rad(angles_np)
+    half_angles = angles_np * 0.5
+    cos_half = np.cos(half_angles)
+    sin_half = np.sin(half_angles)
+
+    quats = _elementary(seq[0], cos_half[:, 0], sin_half[:, 0])
+    for k in range(1, len(seq)):
+        # Write the last product straight into the caller's buffer
+        target = out if k == len(seq) - 1 else None
+        quats = multiply(quats, _elementary(seq[k], cos_half[:, k], sin_half[:, k]), out=target)
+
+    if out is not None and quats is not out:
+        out[...] = quats
+        return out
+    return quats
+
+
+def from_vectors(source: NDArray[np.float64], target: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Minimal rotations taking unit vectors ``source`` onto unit vectors ``target``, batched over frames.
+
+    Closed form of ``R.align_vectors(target, source)`` for a single vector pair: the rotation about
+    ``source x target`` by the angle between them. Antiparallel pairs rotate by pi about an axis
+    perpendicular to ``source``.
+    Args:
+        source: Unit vectors (shape: (3,) or (n, 3)), broadcastable against target.
+        target: Unit vectors (shape: (n, 3)).
+    Returns:
+        Quaternions (shape: (n, 4)) in xyzw format.
+    """
+    source, target = np.broadcast_arrays(source, target)
+    quats = np.empty(source.shape[:-1] + (4,), dtype=np.float64)
+    quats[..., :3] = np.cross(source, target)
+    quats[..., 3] = 1.0 + np.einsum("...i,...i->...", source, target)
+
+    norms = np.sqrt(np.einsum("...i,...i->...", quats, quats))
+    antiparallel = norms < 1e-8
+    if np.any(antiparallel):
+        flipped = source[antiparallel]
+        # Cross with the basis axis least aligned with source gives a perpendicular rotation axis
+        basis = np.eye(3)[np.argmin(np.abs(flipped), axis=-1)]
+        axes = np.cross(flipped, basis)
+        quats[antiparallel, :3] = axes
+        quats[antiparallel, 3] = 0.0
+        norms[antiparallel] = np.linalg.norm(axes, axis=-1)
+    quats /= norms[..., np.newaxis]
+    return quats
+
+
+def _elementary(axis: str, cos_half: NDArray[np.float64], sin_half: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Quaternions (shape: (n, 4)) for rotations about a single principal axis."""
+    quats = np.zeros((cos_half.shape[0], 4), dtype=np.float64)
+    quats[:, _AXIS_INDEX[axis]] = sin_half
+    quats[:, 3] = cos_half
+    return quats
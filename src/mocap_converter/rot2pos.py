@@ -2,56 +2,94 @@ import numpy as np
 from numpy.typing import NDArray
 from scipy.spatial.transform import Rotation as R
 
+from mocap_converter import quaternion
 from mocap_converter.motion_data import MotionData
 
+_IDENTITY_QUAT = np.array([0.0, 0.0, 0.0, 1.0])
 
-def get_positions_from_rotations(
+
+def _traversal_order(motion_data: MotionData, start_node_name: str) -> tuple[list[str], list[int]]:
+    """Pre-order node names below start_node_name and the row of each node's parent (-1 for the start).
+
+    Descent stops at nodes without rotations: their own position is defined, their children's is not.
+    """
+    tree = motion_data.kinematic_tree
+    names: list[str] = []
+    parent_rows: list[int] = []
+    stack: list[tuple[str, int]] = [(start_node_name, -1)]
+    while stack:
+        node_name, parent_row = stack.pop()
+        row = len(names)
+        names.append(node_name)
+        parent_rows.append(parent_row)
+        if motion_data.has_rotations(node_name):
+            stack.extend((child.name, row) for child in reversed(tree.get_children(node_name)))
+    return names, parent_rows
+
+
+def get_position_array_from_rotations(
     motion_data: MotionData,
     parent_position: NDArray[np.float64],
     current_node_name: str,
     accum_rot: R = R.identity(),
     scale: float = 1,
-) -> dict[str, NDArray[np.float64]]:
-    if not motion_data.has_rotations(current_node_name):
-        return {}
+) -> tuple[dict[str, int], NDArray[np.float64]]:
+    """Forward kinematics into one contiguous buffer.
 
-    positions: dict[str, NDArray[np.float64]] = {current_node_name: parent_position}
-    rot_np = motion_data.rotations[current_node_name]
-    rotation = accum_rot * R.from_quat(rot_np)
+    Args:
+        motion_data: Motion data holding the rotations (xyzw) of every joint below current_node_name.
+        parent_position: Position of current_node_name (shape: (frames, 3)).
+        current_node_name: Node to start from.
+        accum_rot: Rotation accumulated above current_node_name.
+        scale: Factor applied to every offset.
+    Returns:
+        The row of each reached node in pre-order, and positions (shape: (nodes, frames, 3)).
+    """
+    if not motion_data.has_rotations(current_node_name):
+        return {}, np.empty((0, motion_data.frame_count, 3), dtype=np.float64)
 
     tree = motion_data.kinematic_tree
-    children = tree.get_children(current_node_name)
-
-    if not children:
-        return positions
-
-    if len(children) == 1:  # Joint has a child
-        child_node = children[0]
-        offset = child_node.offset
-        rotated_offset = rotation.apply(offset)
-        positions[child_node.name] = parent_position + rotated_offset * scale
-
-        r = get_positions_from_rotations(
-            motion_data,
-            positions[child_node.name],
-            child_node.name,
-            rotation,
-            scale,
-        )
-        positions.update(r)
-    else:  # Joint has children
-        for child_node in children:
-            offset = child_node.offset
-            rotated_offset = rotation.apply(offset)
-            positions[child_node.name] = parent_position + rotated_offset * scale
-
-            r = get_positions_from_rotations(
-                motion_data,
-                positions[child_node.name],
-                child_node.name,
-                rotation,
-                scale,
-            )
-            positions.update(r)
-
-    return positions
+    rotations = motion_data.rotations
+    names, parent_rows = _traversal_order(motion_data, current_node_name)
+
+    # One pass over the precomputed order; every step composes and rotates all frames at once
+    root_quat = accum_rot.as_quat()
+    # The default identity start composes to the local rotation itself, so that product is skipped
+    if root_quat.shape == (4,) and np.array_equal(root_quat, _IDENTITY_QUAT):
+        root_quat = None
+    accum_quats = np.empty((len(names), motion_data.frame_count, 4), dtype=np.float64)
+    positions = np.empty((len(names), motion_data.frame_count, 3), dtype=np.float64)
+    for row, (node_name, parent_row) in enumerate(zip(names, parent_rows)):
+        if parent_row < 0:
+            positions[row] = parent_position
+            parent_quat = root_quat
+        else:
+            parent_quat = accum_quats[parent_row]
+            offset = tree.nodes[node_name].offset
+            if scale != 1:
+                offset = offset * scale  # rotation is linear, so scale the 3-vector rather than all frames
+            np.add(positions[parent_row], quaternion.rotate(parent_quat, offset), out=positions[row])
+
+        if motion_data.has_rotations(node_name):
+            # R.from_quat normalizes its input; keep that for caller-provided quaternions
+            if parent_quat is None:
+                quaternion.normalize(rotations[node_name], out=accum_quats[row])
+            else:
+                local_quat = quaternion.normalize(rotations[node_name])
+                quaternion.multiply(parent_quat, local_quat, out=accum_quats[row])  # accum_rot * R.from_quat(rot)
+
+    return {name: row for row, name in enumerate(names)}, positions
+
+
+def get_positions_from_rotations(
+    motion_data: MotionData,
+    parent_position: NDArray[np.float64],
+    current_node_name: str,
+    accum_rot: R = R.identity(),
+    scale: float = 1,
+) -> dict[str, NDArray[np.float64]]:
+    rows, positions = get_position_array_from_rotations(
+        motion_data, parent_position, current_node_name, accum_rot, scale
+    )
+    # Per-node rows are views into the shared buffer
+    return {name: positions[row] for name, row in rows.items()}
@@ -2,10 +2,11 @@ import tempfile
 from pathlib import Path
 from typing import Generator
 
+import numpy as np
 import pytest
 from scipy.spatial.transform import Rotation as R
 
-from mocap_converter.io.bvh.loader import load_bvh
+from mocap_converter.io.bvh.loader import ParseError, load_bvh, parse_bvh_content
 
 bvh_content = """
 HIERARCHY
@@ -115,3 +116,92 @@ def test_bvh_loader(create_bvh_file: Path):
     assert left_leg_rotations.shape == (2, 4)
     assert left_leg_rotations[0].tolist() == test_rot[0].tolist()
     assert left_leg_rotations[1].tolist() == test_rot[1].tolist()
+
+
+@pytest.mark.parametrize(
+    "frame_lines",
+    [
+        "0.0 0.1 0.2 0.0 0.0 0.0 90.0 0.0 90.0 180.0 90.0\n0.1 0.2 0.3 0.0 180.0 0.0 45.0 0.0 45.0 90.0 45.0 0",
+        "0.0 0.1 0.2 0.0 0.0 0.0 90.0 0.0 90.0 180.0 90.0 x\n0.1 0.2 0.3 0.0 180.0 0.0 45.0 0.0 45.0 90.0 45.0 0",
+        "0.0 0.1 0.2 0.0 0.0 0.0 90.0 0.0 90.0 180.0 90.0 0",
+        # Right total value count, wrong row structure
+        "0.0 0.1 0.2 0.0 0.0 0.0 90.0 0.0 90.0 180.0 90.0 0 0.1 0.2 0.3 0.0 180.0 0.0 45.0 0.0 45.0 90.0 45.0 0",
+        "0.0 0.1 0.2 0.0 0.0 0.0 90.0 0.0 90.0 180.0 90.0 0 0.1\n0.2 0.3 0.0 180.0 0.0 45.0 0.0 45.0 90.0 45.0 0",
+    ],
+    ids=["missing-value", "invalid-value", "missing-frame", "single-line", "uneven-rows"],
+)
+def test_bvh_loader_invalid_frame_data(frame_lines: str):
+    hierarchy = bvh_content.split("MOTION")[0]
+    content = f"{hierarchy}MOTION\nFrames: 2\nFrame Time: 0.033333\n{frame_lines}\n"
+
+    with pytest.raises(ParseError):
+        parse_bvh_content(content)
+
+
+@pytest.mark.parametrize(
+    ("line", "malformed_line", "line_number"),
+    [
+        ("OFFSET 1.0 0.0 0.0", "OFFSET 1.0 0.0 0.0 5", 9),
+        ("OFFSET 0.0 1.0 0.0", "OFFSET 0.0 1.0", 13),
+        (
+            "CHANNELS 3 Zrotation Xrotation Yrotation\n        JOINT",
+            "CHANNELS 3 Zrotation Xrotation Yrotation Xposition\n        JOINT",
+            10,
+        ),
+    ],
+    ids=["extra-offset-value", "missing-offset-value", "extra-channel"],
+)
+def test_bvh_loader_invalid_hierarchy_line(line: str, malformed_line: str, line_number: int):
+    content = bvh_content.replace(line, malformed_line, 1)
+
+    with pytest.raises(ParseError, match=f"at line {line_number}"):
+        parse_bvh_content(content)
+
+
+@pytest.mark.parametrize("line_ending", ["\r", "\r\n"], ids=["cr", "crlf"])
+def test_bvh_loader_line_endings(line_ending: str):
+    expected = parse_bvh_content(bvh_content)
+    motion_data = parse_bvh_content(bvh_content.replace("\n", line_ending))
+
+    assert motion_data.kinematic_tree == expected.kinematic_tree
+    assert motion_data.frame_count == expected.frame_count
+    np.testing.assert_array_equal(motion_data.positions["Hips"], expected.positions["Hips"])
+    np.testing.assert_array_equal(motion_data.rotations["LeftLeg"], expected.rotations["LeftLeg"])
+
+
+def test_bvh_loader_mixed_channel_orders():
+    content = """
+HIERARCHY
+ROOT Hips
+{
+    OFFSET 0.0 0.0 0.0
+    CHANNELS 6 Zposition Xposition Yposition Xrotation Yrotation Zrotation
+    JOINT Spine
+    {
+        OFFSET 0.0 1.0 0.0
+        CHANNELS 3 Yrotation Zrotation Xrotation
+        End Site
+        {
+            OFFSET 0.0 1.0 0.0
+        }
+    }
+}
+MOTION
+Frames: 3
+Frame Time: 0.033333
+0.3 0.1 0.2 10.0 20.0 30.0 40.0 50.0 60.0
+0.6 0.4 0.5 15.0 25.0 35.0 45.0 55.0 65.0
+0.9 0.7 0.8 -10.0 -20.0 -30.0 -40.0 -50.0 -60.0
+"""
+    motion_data = parse_bvh_content(content)
+
+    np.testing.assert_array_equal(motion_data.positions["Hips"], [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]])
+
+    # Batched conversion must match frame-by-frame conversion for every rotation order
+    hips_euler = [[10.0, 20.0, 30.0], [15.0, 25.0, 35.0], [-10.0, -20.0, -30.0]]
+    spine_euler = [[40.0, 50.0, 60.0], [45.0, 55.0, 65.0], [-40.0, -50.0, -60.0]]
+    for frame in range(3):
+        expected_hips = R.from_euler("XYZ", hips_euler[frame], degrees=True).as_quat()
+        expected_spine = R.from_euler("YZX", spine_euler[frame], degrees=True).as_quat()
+        np.testing.assert_allclose(motion_data.rotations["Hips"][frame], expected_hips)
+        np.testing.assert_allclose(motion_data.rotations["Spine"][frame], expected_spine)
@@ -11,7 +11,7 @@ from scipy.spatial.transform import Rotation as R
 from mocap_converter.io.bvh.channel_layout import BVHChannelLayout
 from mocap_converter.io.bvh.saver import _build_hierarchy_string, save_bvh
 from mocap_converter.kinematic_tree import KinematicTree
-from mocap_converter.io.bvh.loader import load_bvh
+from mocap_converter.io.bvh.loader import load_bvh, parse_bvh_content
 from mocap_converter.motion_data import MotionData
 
 
@@ -152,17 +152,18 @@ def test_save_bvh_motion_values() -> None:
             pass
 
 
+_FIXTURES_DIR: Path = Path(__file__).resolve().parents[2] / "fixtures"
+
+
 def _list_fixture_bvh_files() -> list[Path]:
     """Discover all BVH files under tests/fixtures recursively."""
-    tests_dir: Path = Path(__file__).resolve().parents[2]
-    fixtures_dir: Path = tests_dir / "fixtures"
-    return sorted(fixtures_dir.rglob("*.bvh"))
+    return sorted(_FIXTURES_DIR.rglob("*.bvh"))
 
 
 @pytest.mark.parametrize(
     "fixture_path",
     _list_fixture_bvh_files(),
-    ids=lambda p: str(p.relative_to(Path(__file__).resolve().parents[2] / "fixtures").as_posix()),
+    ids=lambda p: str(p.relative_to(_FIXTURES_DIR).as_posix()),
 )
 def test_save_load_roundtrip_with_fixture(fixture_path: Path) -> None:
     # Ensure fixture exists
@@ -205,3 +206,78 @@ def test_save_load_roundtrip_with_fixture(fixture_path: Path) -> None:
             out_path.unlink()
         except FileNotFoundError:
             pass
+
+
+def test_save_bvh_reordered_position_channels() -> None:
+    kinematic_tree: KinematicTree = KinematicTree.from_params(
+        [
+            {"name": "root", "parent_name": None},
+            {"name": "child", "parent_name": "root"},
+        ]
+    )
+    root_pos: NDArray[np.float64] = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float64)
+    root_quat: NDArray[np.float64] = R.from_euler(
+        "XYZ", [[10.0, 20.0, 30.0], [40.0, 50.0, 60.0]], degrees=True
+    ).as_quat()
+    motion = MotionData(kinematic_tree, positions={"root": root_pos}, rotations={"root": root_quat})
+
+    channel_layouts: dict[str, BVHChannelLayout] = {
+        "root": BVHChannelLayout.from_bvh_channels(
+            ("Zposition", "Xposition", "Yposition", "Xrotation", "Yrotation", "Zrotation")
+        ),
+    }
+
+    with tempfile.NamedTemporaryFile(suffix=".bvh", delete=False) as f:
+        out_path: Path = Path(f.name)
+
+    try:
+        save_bvh(motion, str(out_path), channel_layouts)
+        reloaded: MotionData = load_bvh(str(out_path))
+
+        assert np.allclose(reloaded.positions["root"], root_pos, atol=1e-6)
+        angles = (R.from_quat(reloaded.rotations["root"]) * R.from_quat(root_quat).inv()).magnitude()
+        assert np.all(angles < 1e-6)
+    finally:
+        out_path.unlink(missing_ok=True)
+
+
+def test_save_bvh_reuses_source_euler_for_unedited_rotations() -> None:
+    content = """HIERARCHY
+ROOT root
+{
+  OFFSET 0.0 0.0 0.0
+  CHANNELS 6 Xposition Yposition Zposition Zrotation Xrotation Yrotation
+  End Site
+  {
+    OFFSET 0.0 1.0 0.0
+  }
+}
+MOTION
+Frames: 2
+Frame Time: 0.033333
+0.0 0.0 0.0 190.0 0.0 0.0
+0.0 0.0 0.0 0.0 90.0 0.0
+"""
+    motion = parse_bvh_content(content)
+    source = motion.source_euler("root")
+    assert source is not None and source[0] == "ZXY"
+
+    with tempfile.NamedTemporaryFile(suffix=".bvh", delete=False) as f:
+        out_path: Path = Path(f.name)
+
+    try:
+        # Unedited rotations are written back verbatim instead of being re-derived from quaternions
+        save_bvh(motion, str(out_path))
+        saved = load_bvh(str(out_path)).source_euler("root")
+        assert saved is not None
+        np.testing.assert_array_equal(saved[1], source[1])
+    finally:
+        out_path.unlink(missing_ok=True)
+
+    # Replacing the rotations invalidates the cached angles
+    edited = motion.copy_with(rotations={"root": np.array(motion.rotations["root"])})
+    assert edited.source_euler("root") is None
+    retimed = motion.copy_with(frame_time=0.01)
+    kept = retimed.source_euler("root")
+    assert kept is not None and kept[1] is source[1]
+    assert retimed.rotations is motion.rotations and retimed.frame_count == motion.frame_count
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import NamedTuple
 
 import numpy as np
 import pytest
@@ -8,36 +9,39 @@ from scipy.spatial.transform import Rotation as R
 from mocap_converter.io.bvh.loader import load_bvh
 from mocap_converter.motion_data import MotionData
 from mocap_converter.pos2rot import get_rotations_from_positions
-from mocap_converter.rot2pos import get_positions_from_rotations
+from mocap_converter.rot2pos import get_position_array_from_rotations, get_positions_from_rotations
+
+
+_FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
 def _list_fixture_bvh_files() -> list[str]:
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    return sorted(str(p) for p in fixtures_dir.rglob("*.bvh"))
+    return sorted(str(p) for p in _FIXTURES_DIR.rglob("*.bvh"))
 
 
 @pytest.fixture(
+    scope="module",
     params=_list_fixture_bvh_files(),
-    ids=lambda p: str(Path(p).relative_to(Path(__file__).parent / "fixtures").as_posix()),
+    ids=lambda p: str(Path(p).relative_to(_FIXTURES_DIR).as_posix()),
 )
 def sample_bvh_path(request: pytest.FixtureRequest) -> str:
     return str(request.param)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def motion_data(sample_bvh_path: str) -> MotionData:
+    # MotionData is immutable, so one parse per fixture file is shared by every test in the module
     return load_bvh(sample_bvh_path)
 
 
-def test_rot2pos2rot(motion_data: MotionData):
-    """
-    Test the round-trip conversion from rotations to positions and back to rotations.
-    This ensures that the conversion maintains the integrity of the motion data.
-    """
+class RoundTrip(NamedTuple):
+    positional_data: MotionData
+    converted_rotations: dict[str, NDArray[np.float64]]
 
-    print("Testing round-trip conversion...")
 
-    # Get the root node and its initial position
+@pytest.fixture(scope="module")
+def roundtrip(motion_data: MotionData) -> RoundTrip:
+    """Rotations -> positions -> rotations, computed once and shared by the round-trip tests."""
     root_node = motion_data.kinematic_tree.root
     assert root_node is not None, "Root node should exist"
 
@@ -57,30 +61,74 @@ def test_rot2pos2rot(motion_data: MotionData):
 
     # Convert back to rotations
     converted_rotations: dict[str, NDArray[np.float64]] = get_rotations_from_positions(positional_data, root_node.name)
+    return RoundTrip(positional_data, converted_rotations)
+
+
+def _reference_positions(
+    motion_data: MotionData, parent_position: NDArray[np.float64], node_name: str, accum_rot: R, scale: float
+) -> dict[str, NDArray[np.float64]]:
+    """Forward kinematics with scipy Rotations, one recursive call per node, independent of rot2pos."""
+    if not motion_data.has_rotations(node_name):
+        return {}
+    positions = {node_name: parent_position}
+    # scipy's Cython routines reject read-only buffers, so hand them copies
+    rotation = accum_rot * R.from_quat(motion_data.rotations[node_name].copy())
+    for child_node in motion_data.kinematic_tree.get_children(node_name):
+        child_position = parent_position + rotation.apply(child_node.offset.copy()) * scale
+        positions[child_node.name] = child_position
+        positions.update(_reference_positions(motion_data, child_position, child_node.name, rotation, scale))
+    return positions
+
+
+def test_position_array_matches_reference_fk(motion_data: MotionData):
+    root_node = motion_data.kinematic_tree.root
+    assert root_node is not None, "Root node should exist"
+    root_pos = motion_data.positions[root_node.name]
+    accum_rot = R.from_euler("ZXY", [30.0, -45.0, 10.0], degrees=True)
+
+    rows, position_array = get_position_array_from_rotations(
+        motion_data, root_pos, root_node.name, accum_rot, scale=2.5
+    )
+    expected = _reference_positions(motion_data, root_pos, root_node.name, accum_rot, scale=2.5)
+
+    assert sorted(rows) == sorted(expected)
+    assert position_array.shape == (len(rows), motion_data.frame_count, 3)
+    for node_name, row in rows.items():
+        np.testing.assert_allclose(position_array[row], expected[node_name], atol=1e-9, err_msg=node_name)
+
+    positions = get_positions_from_rotations(motion_data, root_pos, root_node.name, accum_rot, scale=2.5)
+    assert list(positions) == list(rows)
 
-    # Compare with original rotations
-    for node_name, converted_rotation_quat in converted_rotations.items():
-        if motion_data.has_rotations(node_name):
-            original_rotation: R = R.from_quat(motion_data.rotations[node_name])
-            converted_rotation: R = R.from_quat(converted_rotation_quat)
 
-            # Calculate relative rotation
-            relative_rots: R = converted_rotation * original_rotation.inv()
+def test_rot2pos2rot(motion_data: MotionData, roundtrip: RoundTrip):
+    """
+    Test the round-trip conversion from rotations to positions and back to rotations.
+    This ensures that the conversion maintains the integrity of the motion data.
+    """
 
-            # Calculate angular error
-            angle_errors = relative_rots.magnitude()
-            mean_angle_error = np.mean(angle_errors)
-            max_angle_error = np.max(angle_errors)
+    print("Testing round-trip conversion...")
 
-            print(
-                f"{node_name}: Mean angle error: {mean_angle_error:.4f} rad, Max angle error: {max_angle_error:.4f} rad"
-            )
+    converted_rotations = roundtrip.converted_rotations
 
-            # Allow for reasonable numerical error
-            assert mean_angle_error < 1e-4, f"Angular error for {node_name} too large: {mean_angle_error} rad"
+    # Compare with original rotations, all nodes at once: (nodes, frames, 4) stacks
+    node_names = [name for name in converted_rotations if motion_data.has_rotations(name)]
+    original_quats = motion_data.get_rotations_stack(node_names)
+    converted_quats = np.stack([converted_rotations[name] for name in node_names])
+    converted_quats /= np.linalg.norm(converted_quats, axis=2, keepdims=True)
 
+    # Angle of the relative rotation, from the quaternion dot product; |dot| folds q and -q together
+    dots = np.abs(np.einsum("nfk,nfk->nf", original_quats, converted_quats))
+    angle_errors: NDArray[np.float64] = 2 * np.arccos(np.clip(dots, 0.0, 1.0))
+    mean_angle_errors = angle_errors.mean(axis=1)
 
-def test_rot2pos2rot2pos(motion_data: MotionData):
+    worst = int(np.argmax(mean_angle_errors))
+    print(f"Worst node {node_names[worst]}: Mean angle error: {mean_angle_errors[worst]:.4e} rad")
+
+    # Allow for reasonable numerical error
+    np.testing.assert_array_less(mean_angle_errors, 1e-4, err_msg=f"Angular error too large; nodes: {node_names}")
+
+
+def test_rot2pos2rot2pos(motion_data: MotionData, roundtrip: RoundTrip):
     """
     Test the round-trip conversion from rotations to positions and back to rotations,
     and then back to positions, ensuring the final positions match the positions obtained from the original motion data.
@@ -92,21 +140,7 @@ def test_rot2pos2rot2pos(motion_data: MotionData):
     assert root_node is not None, "Root node should exist"
 
     root_pos = motion_data.positions[root_node.name]
-
-    # Convert rotations to positions
-    converted_positions: dict[str, NDArray[np.float64]] = get_positions_from_rotations(
-        motion_data, root_pos, root_node.name
-    )
-
-    positional_data: MotionData = MotionData(
-        motion_data.kinematic_tree,
-        positions=converted_positions,
-        rotations=None,
-        frame_time=motion_data.frame_time,
-    )
-
-    # Convert back to rotations
-    converted_rotations: dict[str, NDArray[np.float64]] = get_rotations_from_positions(positional_data, root_node.name)
+    positional_data, converted_rotations = roundtrip
 
     rotational_data: MotionData = MotionData(
         motion_data.kinematic_tree,
@@ -117,23 +151,16 @@ def test_rot2pos2rot2pos(motion_data: MotionData):
 
     root_pos = rotational_data.positions[root_node.name]
 
-    # Convert back to positions
-    final_positions: dict[str, NDArray[np.float64]] = get_positions_from_rotations(
-        rotational_data, root_pos, root_node.name
-    )
-
-    # Compare final positions with original positions
-    for node_name, final_position in final_positions.items():
-        first_position = positional_data.positions[node_name]
+    # Convert back to positions, straight into one (nodes, frames, 3) array
+    rows, final_positions = get_position_array_from_rotations(rotational_data, root_pos, root_node.name)
+    node_names = list(rows)
+    first_positions = np.stack([positional_data.positions[name] for name in node_names])
 
-        # Calculate position error
-        position_errors = np.linalg.norm(final_position - first_position)
-        mean_position_error = np.mean(position_errors)
-        max_position_error = np.max(position_errors)
+    # Position error per node: the norm over all of its frames
+    position_errors = np.linalg.norm(final_positions - first_positions, axis=(1, 2))
 
-        print(
-            f"{node_name}: Mean position error: {mean_position_error:.4f}, Max position error: {max_position_error:.4f}"
-        )
+    worst = int(np.argmax(position_errors))
+    print(f"Worst node {node_names[worst]}: Position error: {position_errors[worst]:.4e}")
 
-        # Allow for reasonable numerical error
-        assert mean_position_error < 1e-4, f"Position error for {node_name} too large: {mean_position_error}"
+    # Allow for reasonable numerical error
+    np.testing.assert_array_less(position_errors, 1e-4, err_msg=f"Position error too large; nodes: {node_names}")
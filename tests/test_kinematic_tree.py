@@ -194,6 +194,54 @@ def test_kinematic_tree_add_node():
     }
 
 
+def test_kinematic_tree_add_nodes():
+    root = Node("root")
+    child1 = Node("child1", parent_name="root")
+    grandchild1 = Node("grandchild1", parent_name="child1")
+
+    # Children may precede their parents; only the finished tree is validated
+    tree = KinematicTree().add_nodes([grandchild1, root, child1])
+    assert tree.root == root
+    assert tree.nodes == {"grandchild1": grandchild1, "root": root, "child1": child1}
+    assert tree.get_depth("grandchild1") == 2
+
+    with pytest.raises(KinematicTree.NotConnectedError):
+        tree.add_nodes([Node("orphan", parent_name="missing")])
+
+
+def test_kinematic_tree_structure_queries():
+    root = Node("root")
+    child1 = Node("child1", parent_name="root")
+    child2 = Node("child2", parent_name="root")
+    grandchild1 = Node("grandchild1", parent_name="child1")
+
+    tree = KinematicTree.from_nodes([root, child1, child2, grandchild1])
+
+    assert tree.get_children("root") == [child1, child2]
+    assert tree.get_children("grandchild1") == []
+    assert tree.get_siblings("child1") == [child2]
+    assert tree.get_siblings("grandchild1") == []
+    assert tree.get_siblings("root") == []
+    assert tree.has_children("child1")
+    assert tree.is_leaf("child2")
+    assert tree.has_siblings("child2")
+    assert not tree.has_siblings("grandchild1")
+    assert not tree.has_siblings("root")
+    assert [tree.get_depth(name) for name in ("root", "child1", "child2", "grandchild1")] == [0, 1, 1, 2]
+    with pytest.raises(KeyError):
+        tree.get_depth("missing")
+    assert tree.topological_order == ("root", "child1", "child2", "grandchild1")
+    assert tree.parent_indices.tolist() == [-1, 0, 0, 1]
+    assert tree.get_descendants("root") == [child1, grandchild1, child2]
+    assert tree.get_descendants("child2") == []
+    assert tree.get_ancestors("grandchild1") == [child1, root]
+    assert tree.get_ancestors("root") == []
+    assert tree.is_ancestor("root", "grandchild1")
+    assert tree.is_ancestor("child1", "grandchild1")
+    assert not tree.is_ancestor("child2", "grandchild1")
+    assert not tree.is_ancestor("child1", "child1")
+
+
 def test_kinematic_tree_validate_no_root():
     tree = KinematicTree()
 
@@ -219,6 +267,15 @@ def test_kinematic_tree_validate_cycle():
         KinematicTree.from_nodes([node1, node2, node3])
 
 
+def test_kinematic_tree_validate_cycle_detached_from_root():
+    root = Node("root")
+    node1 = Node("node1", parent_name="node2")
+    node2 = Node("node2", parent_name="node1")
+
+    with pytest.raises(KinematicTree.CircularReferenceError):
+        KinematicTree.from_nodes([root, node1, node2])
+
+
 def test_kinematic_tree_validate_node_not_connected():
     root = Node("root")
     child = Node("child", parent_name="nonexistent_parent")
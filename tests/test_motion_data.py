@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from mocap_converter.kinematic_tree import KinematicTree
+from mocap_converter.motion_data import MotionData
+from mocap_converter.node import Node
+
+
+def test_get_rotations_stack():
+    tree = KinematicTree.from_nodes([Node("root"), Node("child", parent_name="root")])
+    rotations = {
+        "root": np.tile([0.0, 0.0, 0.0, 1.0], (5, 1)),
+        "child": np.tile([0.0, 0.0, 1.0, 0.0], (5, 1)),
+    }
+    motion = MotionData(tree, rotations=rotations)
+
+    stack = motion.get_rotations_stack()
+    assert stack.shape == (2, 5, 4)
+    assert not stack.flags.writeable
+    np.testing.assert_array_equal(stack[1], rotations["child"])
+    # The latest order is cached; a different order is stacked anew
+    assert motion.get_rotations_stack(["root", "child"]) is stack
+    np.testing.assert_array_equal(motion.get_rotations_stack(["child", "root"])[0], rotations["child"])
+
+    with pytest.raises(KeyError):
+        motion.get_rotations_stack(["missing"])
@@ -1,3 +1,8 @@
+import dataclasses
+import pickle
+
+import numpy as np
+
 from mocap_converter.kinematic_tree import KinematicTree
 from mocap_converter.node import Node
 
@@ -19,6 +24,66 @@ def test_node():
     assert child.parent_name == "parent"  # Original unchanged
 
 
+def test_node_offset_is_isolated():
+    offset = np.array([1.0, 2.0, 3.0])
+    node = Node("node", offset=offset)
+    offset[0] = 10.0
+    assert node.offset[0] == 1.0
+    assert not node.offset.flags.writeable
+
+    # A read-only caller array is still copied, since its owner can make it writeable again
+    frozen = np.array([1.0, 2.0, 3.0])
+    frozen.setflags(write=False)
+    frozen_node = Node("frozen", offset=frozen)
+    assert frozen_node.offset is not frozen
+    frozen.setflags(write=True)
+    frozen[0] = 10.0
+    assert frozen_node.offset[0] == 1.0
+    assert frozen_node == Node("frozen", offset=np.array([1.0, 2.0, 3.0]))
+
+    # A node's own frozen offset is shared rather than copied again
+    assert node.copy_with(name="renamed").offset is node.offset
+
+    # Hashes agree with equality, including signed zeros
+    assert hash(Node("z", offset=np.array([-0.0, 0.0, 0.0]))) == hash(Node("z"))
+
+    # Default offsets are zero and read-only
+    default = Node("default")
+    assert np.array_equal(default.offset, np.zeros(3))
+    assert not default.offset.flags.writeable
+
+
+def test_node_hash_cache_is_not_a_field():
+    node = Node("node", parent_name="root")
+    _ = hash(node)
+
+    assert [f.name for f in dataclasses.fields(Node)] == ["name", "parent_name", "offset"]
+    assert set(dataclasses.asdict(node)) == {"name", "parent_name", "offset"}
+    renamed = dataclasses.replace(node, name="renamed")
+    assert hash(renamed) == hash(Node("renamed", parent_name="root"))
+
+
+def test_node_pickle_roundtrip():
+    node = Node("node", parent_name="root", offset=np.array([1.0, 2.0, 3.0]))
+    _ = hash(node)
+
+    restored = pickle.loads(pickle.dumps(node))
+    assert restored == node
+    assert hash(restored) == hash(node)
+    assert not restored.offset.flags.writeable
+
+
+def test_node_with_str_subclass_names():
+    root = Node(np.str_("Hips"))
+    child = Node(np.str_("Spine"), parent_name=np.str_("Hips"))
+    assert root == Node("Hips")
+    assert hash(child) == hash(Node("Spine", parent_name="Hips"))
+
+    tree = KinematicTree.from_nodes([root, child])
+    assert tree.get_children("Hips") == [child]
+    assert pickle.loads(pickle.dumps(child)) == child
+
+
 def test_node_depth():
     # Create nodes for tree structure
     root = Node("root")
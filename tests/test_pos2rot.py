@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from mocap_converter.kinematic_tree import KinematicTree
+from mocap_converter.motion_data import MotionData
+from mocap_converter.node import Node
+from mocap_converter.pos2rot import apply_rotations, get_align_rotations, get_rotations_from_positions
+
+
+@pytest.mark.parametrize("n_samples", [1, 2, 3])
+def test_get_align_rotations_matches_align_vectors(n_samples: int):
+    rng = np.random.default_rng(0)
+    initial_offset = rng.normal(size=(n_samples, 3))
+    initial_offset /= np.linalg.norm(initial_offset, axis=1, keepdims=True)
+    # Rotated copies of the initial offsets plus noise, so multi-sample fits are not exact
+    truth = R.random(16, random_state=1)
+    local_offsets = np.stack([truth[i].apply(initial_offset) for i in range(16)])
+    local_offsets += rng.normal(scale=0.05, size=local_offsets.shape)
+    local_offsets /= np.linalg.norm(local_offsets, axis=2, keepdims=True)
+
+    rotations = get_align_rotations(local_offsets, initial_offset)
+
+    for i in range(16):
+        expected = R.align_vectors(local_offsets[i], initial_offset)[0]
+        assert (rotations[i] * expected.inv()).magnitude() < 1e-8
+
+
+def test_apply_rotations_normalizes_quaternions():
+    rot = np.array([[0.0, 0.0, 1.0, 1.0], [0.5, -1.0, 2.0, 3.0]])
+    vec = np.random.default_rng(0).normal(size=(2, 5, 3))
+
+    rotated = apply_rotations(rot, vec)
+
+    for i in range(2):
+        np.testing.assert_allclose(rotated[i], R.from_quat(rot[i]).apply(vec[i]), atol=1e-12)
+
+
+def test_get_rotations_from_positions_leaves_do_not_share_buffers():
+    tree = KinematicTree.from_nodes(
+        [
+            Node("root"),
+            Node("left", parent_name="root", offset=np.array([1.0, 0.0, 0.0])),
+            Node("right", parent_name="root", offset=np.array([-1.0, 0.0, 0.0])),
+        ]
+    )
+    positions = {
+        "root": np.zeros((4, 3)),
+        "left": np.tile([1.0, 0.0, 0.0], (4, 1)),
+        "right": np.tile([-1.0, 0.0, 0.0], (4, 1)),
+    }
+    rotations = get_rotations_from_positions(MotionData(tree, positions=positions), "root")
+
+    rotations["left"][0] = [1.0, 0.0, 0.0, 0.0]
+    np.testing.assert_array_equal(rotations["right"], np.tile([0.0, 0.0, 0.0, 1.0], (4, 1)))
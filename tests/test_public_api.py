@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import mocap_converter as mc
 
 
@@ -8,6 +11,7 @@ def test_top_level_exports() -> None:
     assert callable(mc.adjust_kinematic_tree)
     assert callable(mc.get_rotations_from_positions)
     assert callable(mc.get_positions_from_rotations)
+    assert callable(mc.get_position_array_from_rotations)
     assert callable(mc.save_bvh)
     assert callable(mc.load_bvh)
 
@@ -16,3 +20,9 @@ def test_adapter_namespace_exports() -> None:
     assert hasattr(mc, "adapter")
     assert hasattr(mc.adapter, "AZURE_KINECT_KINEMATIC_TREE")
     assert hasattr(mc.adapter, "get_positions_from_json")
+
+
+def test_import_defers_scipy() -> None:
+    # Fresh interpreter, since this test session has already imported the conversion modules
+    code = "import sys, mocap_converter; assert not any(m.startswith('scipy') for m in sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation as R
+
+from mocap_converter.quaternion import from_euler, from_vectors, multiply, normalize, rotate
+
+
+@pytest.mark.parametrize("seq", ["XYZ", "XZY", "YXZ", "YZX", "ZXY", "ZYX", "ZX", "Y"])
+def test_from_euler_matches_scipy(seq: str):
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(-180.0, 180.0, size=(64, len(seq)))
+
+    expected = R.from_euler(seq, angles, degrees=True).as_quat()
+    np.testing.assert_allclose(from_euler(seq, angles, degrees=True), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("seq", ["ZXY", "Y"])
+def test_from_euler_writes_into_out(seq: str):
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(-180.0, 180.0, size=(16, len(seq)))
+    buffer = np.zeros((16, 3, 4))
+
+    result = from_euler(seq, angles, degrees=True, out=buffer[:, 1])
+
+    assert np.shares_memory(result, buffer)
+    np.testing.assert_allclose(buffer[:, 1], R.from_euler(seq, angles, degrees=True).as_quat(), atol=1e-12)
+    np.testing.assert_array_equal(buffer[:, [0, 2]], 0.0)
+
+
+def test_from_euler_rejects_extrinsic_sequences():
+    with pytest.raises(ValueError):
+        from_euler("zxy", np.zeros((1, 3)))
+
+
+def test_multiply_matches_scipy():
+    rng = np.random.default_rng(0)
+    p = R.random(32, random_state=rng)
+    q = R.random(32, random_state=rng)
+
+    np.testing.assert_allclose(multiply(p.as_quat(), q.as_quat()), (p * q).as_quat(), atol=1e-12)
+
+
+def test_from_vectors_matches_align_vectors():
+    rng = np.random.default_rng(0)
+    source = rng.normal(size=3)
+    source /= np.linalg.norm(source)
+    target = rng.normal(size=(32, 3))
+    target /= np.linalg.norm(target, axis=1, keepdims=True)
+
+    quats = from_vectors(source, target)
+
+    for quat, vec in zip(quats, target):
+        expected = R.align_vectors(vec[np.newaxis], source[np.newaxis])[0]
+        assert (R.from_quat(quat) * expected.inv()).magnitude() < 1e-10
+    np.testing.assert_allclose(R.from_quat(quats).apply(source), target, atol=1e-12)
+
+
+def test_from_vectors_handles_parallel_and_antiparallel():
+    source = np.array([0.0, 1.0, 0.0])
+    target = np.array([[0.0, 1.0, 0.0], [0.0, -1.0, 0.0]])
+
+    quats = from_vectors(source, target)
+
+    np.testing.assert_allclose(quats[0], [0.0, 0.0, 0.0, 1.0], atol=1e-12)
+    np.testing.assert_allclose(R.from_quat(quats).apply(source), target, atol=1e-12)
+
+
+def test_rotate_matches_scipy():
+    rng = np.random.default_rng(0)
+    rotations = R.random(8, random_state=0)
+    vectors = rng.normal(size=(8, 5, 3))
+
+    expected = np.stack([rotations[i].apply(vectors[i]) for i in range(8)])
+    np.testing.assert_allclose(rotate(rotations.as_quat()[:, np.newaxis], vectors), expected, atol=1e-12)
+
+
+def test_normalize_in_place():
+    rng = np.random.default_rng(0)
+    quats = rng.normal(size=(8, 2, 4))
+    expected = quats / np.linalg.norm(quats, axis=-1, keepdims=True)
+
+    result = normalize(quats, out=quats)
+
+    assert result is quats
+    np.testing.assert_allclose(quats, expected, atol=1e-15)